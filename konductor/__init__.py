@@ -2,16 +2,32 @@
 Konductor: A declarative configuration engine for building AI Agents.
 """
 
+from typing import Any
+
 from .core.generator import KonductorGenerator
 from .core.models import ParsedManifest
 from .core.parser import ManifestParser
-from .providers.base import provider_registry
+from .providers.base import CodeGenerator, provider_registry
+
+
+def _load_google_adk() -> CodeGenerator:
+    # Deferred so commands that never generate code don't import Jinja and the templates
+    from .providers.google_adk.generator import GoogleAdkGenerator
+
+    return GoogleAdkGenerator()
 
-# Register providers
-from .providers.google_adk.generator import GoogleAdkGenerator
 
 # Register Google ADK provider
-provider_registry.register("google_adk", GoogleAdkGenerator())
+provider_registry.register_lazy("google_adk", _load_google_adk)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "GoogleAdkGenerator":
+        from .providers.google_adk.generator import GoogleAdkGenerator
+
+        return GoogleAdkGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = "0.1.0"
 __all__ = ["KonductorGenerator", "ManifestParser", "ParsedManifest"]
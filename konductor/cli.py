@@ -3,14 +3,22 @@ Command-line interface for Konductor.
 """
 
 import argparse
+import logging
 import os
 import sys
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Sequence
 
 from .core.generator import KonductorGenerator
 
+# Shows konductor's progress messages like regular output, without touching the root logger
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(message)s"))
 
-def main() -> None:
-    """Main CLI entry point."""
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once per process."""
     parser = argparse.ArgumentParser(
         description="Generate agent code from Konductor YAML manifests.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -18,6 +26,7 @@ def main() -> None:
 Examples:
   konductor generate simple_agent.yaml
   konductor generate -p google_adk -o my_agent simple_agent.yaml
+  cat simple_agent.yaml | konductor generate -
   konductor list-providers
         """,
     )
@@ -26,7 +35,9 @@ Examples:
 
     # Generate command
     generate_parser = subparsers.add_parser("generate", help="Generate code from manifest")
-    generate_parser.add_argument("manifest_file", help="Path to the input YAML manifest file")
+    generate_parser.add_argument(
+        "manifest_file", help="Path to the input YAML manifest file, or '-' to read it from stdin"
+    )
     generate_parser.add_argument(
         "-p",
         "--provider",
@@ -41,7 +52,7 @@ Examples:
     )
 
     # List providers command
-    list_parser = subparsers.add_parser("list-providers", help="List available providers")
+    subparsers.add_parser("list-providers", help="List available providers")
 
     # Dependencies command
     deps_parser = subparsers.add_parser("dependencies", help="Show required dependencies")
@@ -52,35 +63,63 @@ Examples:
         help="Provider to show dependencies for (default: google_adk)",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def _cmd_generate(args: argparse.Namespace) -> None:
+    from_stdin = args.manifest_file == "-"
+    if not from_stdin and not os.path.exists(args.manifest_file):
+        print(f"Error: Manifest file not found at '{args.manifest_file}'")
+        sys.exit(1)
+
+    generator = KonductorGenerator(provider=args.provider)
+    if from_stdin:
+        generator.generate_from_manifest_string(sys.stdin.read(), args.output_dir)
+    else:
+        generator.generate_from_manifest(args.manifest_file, args.output_dir)
+
+
+def _cmd_list_providers(_args: argparse.Namespace) -> None:
+    generator = KonductorGenerator()
+    providers = generator.list_available_providers()
+    print("Available providers:")
+    for provider in providers:
+        print(f"  - {provider}")
+
+
+def _cmd_dependencies(args: argparse.Namespace) -> None:
+    generator = KonductorGenerator(provider=args.provider)
+    deps_info = generator.get_required_dependencies()
+    print(f"Dependencies for provider '{deps_info['provider']}':")
+    for dep in deps_info["dependencies"]:
+        print(f"  - {dep}")
+
+
+COMMANDS: Dict[str, Callable[[argparse.Namespace], None]] = {
+    "generate": _cmd_generate,
+    "list-providers": _cmd_list_providers,
+    "dependencies": _cmd_dependencies,
+}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Main CLI entry point; argv defaults to the process arguments."""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    # Progress messages from the library go through logging; show them like regular output.
+    # Re-target the handler on each call so it follows the current sys.stdout
+    _log_handler.stream = sys.stdout
+    package_logger = logging.getLogger("konductor")
+    package_logger.addHandler(_log_handler)
+    package_logger.setLevel(logging.INFO)
 
     if not args.command:
         parser.print_help()
         return
 
     try:
-        if args.command == "generate":
-            if not os.path.exists(args.manifest_file):
-                print(f"Error: Manifest file not found at '{args.manifest_file}'")
-                sys.exit(1)
-
-            generator = KonductorGenerator(provider=args.provider)
-            generator.generate_from_manifest(args.manifest_file, args.output_dir)
-
-        elif args.command == "list-providers":
-            generator = KonductorGenerator()
-            providers = generator.list_available_providers()
-            print("Available providers:")
-            for provider in providers:
-                print(f"  - {provider}")
-
-        elif args.command == "dependencies":
-            generator = KonductorGenerator(provider=args.provider)
-            deps_info = generator.get_required_dependencies()
-            print(f"Dependencies for provider '{deps_info['provider']}':")
-            for dep in deps_info["dependencies"]:
-                print(f"  - {dep}")
-
+        COMMANDS[args.command](args)
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
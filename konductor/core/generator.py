@@ -2,6 +2,7 @@
 Main code generation orchestrator for Konductor.
 """
 
+import logging
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 if TYPE_CHECKING:
@@ -11,6 +12,8 @@ from ..providers.base import provider_registry
 from .models import ParsedManifest
 from .parser import ManifestParser
 
+logger = logging.getLogger(__name__)
+
 
 class KonductorGenerator:
     """Main generator that orchestrates provider-specific code generation."""
@@ -43,9 +46,28 @@ class KonductorGenerator:
         Returns:
             Dictionary mapping file paths to generated content
         """
-        # Parse the manifest
-        manifest = self.parser.parse_manifest(manifest_path)
+        return self._generate(self.parser.parse_manifest(manifest_path), output_dir, **kwargs)
+
+    def generate_from_manifest_string(
+        self, manifest_text: str, output_dir: str = "generated_agent", **kwargs: Any
+    ) -> Dict[str, str]:
+        """
+        Generate code from YAML manifest text, such as a manifest read from stdin.
+
+        Args:
+            manifest_text: Contents of a YAML manifest
+            output_dir: Directory to output generated code
+            **kwargs: Additional provider-specific options
+
+        Returns:
+            Dictionary mapping file paths to generated content
+        """
+        return self._generate(
+            self.parser.parse_manifest_string(manifest_text), output_dir, **kwargs
+        )
 
+    def _generate(self, manifest: ParsedManifest, output_dir: str, **kwargs: Any) -> Dict[str, str]:
+        """Validate a parsed manifest and generate code from it."""
         # Validate the manifest
         validation_errors = self.parser.validate_manifest(manifest)
         if validation_errors:
@@ -57,10 +79,10 @@ class KonductorGenerator:
             raise ValueError(f"Provider validation failed:\n" + "\n".join(provider_errors))
 
         # Generate code
-        print(f"Generating code using provider: {self.provider_name}")
+        logger.info("Generating code using provider: %s", self.provider_name)
         generated_files = self.provider.generate_code(manifest, output_dir, **kwargs)
 
-        print(f"\nCode generation complete. Files are in '{output_dir}' directory.")
+        logger.info("Code generation complete. Files are in '%s' directory.", output_dir)
         return generated_files  # type: ignore[no-any-return]
 
     def get_required_dependencies(self) -> Dict[str, Any]:
@@ -2,16 +2,28 @@
 Provider-agnostic core models for Konductor.
 """
 
+import sys
 from abc import ABC
-from typing import Any, Dict, List, Optional, Type, Union
+from itertools import chain
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, Iterator, List, Mapping, Optional, Type, Union
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+
+# Resource names and the references to them are short and heavily repeated; interning lets
+# the name-set lookups in validation match by identity before comparing characters
+ResourceName = Annotated[str, AfterValidator(sys.intern)]
+
+# Resources are read-only once parsed; unknown keys are dropped rather than kept as extras
+_RESOURCE_CONFIG = ConfigDict(extra="ignore", frozen=True)
 
 
 class Metadata(BaseModel):
     """Common metadata for all resources."""
 
-    name: str
+    model_config = _RESOURCE_CONFIG
+
+    name: ResourceName
     labels: Optional[Dict[str, str]] = Field(default_factory=dict)
     annotations: Optional[Dict[str, str]] = Field(default_factory=dict)
 
@@ -19,10 +31,14 @@ class Metadata(BaseModel):
 class ResourceSpec(BaseModel, ABC):
     """Base class for all resource specifications."""
 
+    model_config = _RESOURCE_CONFIG
+
 
 class Resource(BaseModel, ABC):
     """Base class for all Konductor resources."""
 
+    model_config = _RESOURCE_CONFIG
+
     apiVersion: str
     kind: str
     metadata: Metadata
@@ -32,6 +48,8 @@ class Resource(BaseModel, ABC):
 class ToolParameter(BaseModel):
     """Parameter definition for tools."""
 
+    model_config = _RESOURCE_CONFIG
+
     name: str
     type: str
     description: str
@@ -41,6 +59,8 @@ class ToolParameter(BaseModel):
 class ToolSource(BaseModel):
     """Source reference for tool implementations."""
 
+    model_config = _RESOURCE_CONFIG
+
     file: str
     functionName: str
 
@@ -64,6 +84,8 @@ class ToolResource(Resource):
 class RetryOptions(BaseModel):
     """Retry configuration for model requests."""
 
+    model_config = _RESOURCE_CONFIG
+
     attempts: Optional[int] = None
     initialDelay: Optional[float] = None
     maxDelay: Optional[float] = None
@@ -92,13 +114,13 @@ class AgentSpec(ResourceSpec):
     """Base specification for agent resources."""
 
     instruction: str
-    toolRefs: Optional[List[str]] = Field(default_factory=list)
+    toolRefs: Optional[List[ResourceName]] = Field(default_factory=list)
 
 
 class LlmAgentSpec(AgentSpec):
     """Specification for LLM agent resources."""
 
-    modelRef: str
+    modelRef: ResourceName
     output_key: Optional[str] = None
 
 
@@ -112,8 +134,8 @@ class LlmAgentResource(Resource):
 class SequentialAgentSpec(ResourceSpec):
     """Specification for sequential agent resources."""
 
-    subAgentRefs: List[str]
-    toolRefs: Optional[List[str]] = Field(
+    subAgentRefs: List[ResourceName]
+    toolRefs: Optional[List[ResourceName]] = Field(
         default_factory=list
     )  # Optional tools for sequential agents
 
@@ -128,7 +150,7 @@ class SequentialAgentResource(Resource):
 class LoopAgentSpec(ResourceSpec):
     """Specification for loop agent resources."""
 
-    subAgentRefs: List[str]
+    subAgentRefs: List[ResourceName]
     maxIterations: Optional[int] = None
 
 
@@ -142,7 +164,7 @@ class LoopAgentResource(Resource):
 class ParallelAgentSpec(ResourceSpec):
     """Specification for parallel agent resources."""
 
-    subAgentRefs: List[str]
+    subAgentRefs: List[ResourceName]
 
 
 class ParallelAgentResource(Resource):
@@ -163,6 +185,15 @@ RESOURCE_REGISTRY: Dict[str, Type[Resource]] = {
     "ParallelAgent": ParallelAgentResource,
 }
 
+# Read-only view shared by parsers that don't register their own kinds
+RESOURCE_REGISTRY_VIEW: Mapping[str, Type[Resource]] = MappingProxyType(RESOURCE_REGISTRY)
+
+
+AgentResource = Union[
+    LlmAgentResource, SequentialAgentResource, LoopAgentResource, ParallelAgentResource
+]
+WorkflowAgentResource = Union[SequentialAgentResource, LoopAgentResource, ParallelAgentResource]
+
 
 class ParsedManifest(BaseModel):
     """Container for parsed manifest resources."""
@@ -174,21 +205,19 @@ class ParsedManifest(BaseModel):
     loop_agents: List[LoopAgentResource] = Field(default_factory=list)
     parallel_agents: List[ParallelAgentResource] = Field(default_factory=list)
 
-    def get_all_agents(
-        self,
-    ) -> List[
-        Union[LlmAgentResource, SequentialAgentResource, LoopAgentResource, ParallelAgentResource]
-    ]:
+    def iter_all_agents(self) -> Iterator[AgentResource]:
+        """Iterate over all agent resources without building an intermediate list."""
+        return chain(
+            self.llm_agents, self.sequential_agents, self.loop_agents, self.parallel_agents
+        )
+
+    def get_all_agents(self) -> List[AgentResource]:
         """Get all agent resources."""
-        return self.llm_agents + self.sequential_agents + self.loop_agents + self.parallel_agents
+        return list(self.iter_all_agents())
 
-    def find_agent_by_name(
-        self, name: str
-    ) -> Optional[
-        Union[LlmAgentResource, SequentialAgentResource, LoopAgentResource, ParallelAgentResource]
-    ]:
+    def find_agent_by_name(self, name: str) -> Optional[AgentResource]:
         """Find an agent by name."""
-        for agent in self.get_all_agents():
+        for agent in self.iter_all_agents():
             if agent.metadata.name == name:
                 return agent
         return None
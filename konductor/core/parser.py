@@ -2,12 +2,29 @@
 Provider-agnostic manifest parser for Konductor.
 """
 
-from typing import List, Type
+import logging
+import sys
+from functools import lru_cache
+from itertools import chain, groupby
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
-import yaml
+from pydantic import TypeAdapter
 
 from .models import (
-    RESOURCE_REGISTRY,
+    RESOURCE_REGISTRY_VIEW,
     LlmAgentResource,
     LoopAgentResource,
     ModelResource,
@@ -16,123 +33,198 @@ from .models import (
     Resource,
     SequentialAgentResource,
     ToolResource,
+    WorkflowAgentResource,
+)
+
+if TYPE_CHECKING:
+    import yaml
+
+logger = logging.getLogger(__name__)
+
+# ParsedManifest field that collects each built-in resource kind
+_KIND_BUCKETS: Dict[str, str] = {
+    "Tool": "tools",
+    "Model": "models",
+    "LlmModel": "models",  # Backward compatibility
+    "LlmAgent": "llm_agents",
+    "SequentialAgent": "sequential_agents",
+    "LoopAgent": "loop_agents",
+    "ParallelAgent": "parallel_agents",
+}
+
+# Base class -> ParsedManifest field, used to place custom registered kinds
+_CLASS_BUCKETS: Tuple[Tuple[Type[Resource], str], ...] = (
+    (ToolResource, "tools"),
+    (ModelResource, "models"),
+    (LlmAgentResource, "llm_agents"),
+    (SequentialAgentResource, "sequential_agents"),
+    (LoopAgentResource, "loop_agents"),
+    (ParallelAgentResource, "parallel_agents"),
 )
 
 
+def _bucket_for_class(resource_class: Type[Resource]) -> Optional[str]:
+    """Return the ParsedManifest field a resource class belongs to, if any."""
+    for base, bucket in _CLASS_BUCKETS:
+        if issubclass(resource_class, base):
+            return bucket
+    return None
+
+
+@lru_cache(maxsize=None)
+def _safe_loader() -> Union[Type["yaml.SafeLoader"], Type["yaml.CSafeLoader"]]:
+    """Import PyYAML on first parse and return its fastest safe loader."""
+    # Deferred so CLI commands that never read a manifest don't pay for importing PyYAML
+    try:
+        from yaml import CSafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader
+
+        return SafeLoader
+    return CSafeLoader
+
+
+@lru_cache(maxsize=None)
+def _adapter_for(resource_class: Type[Resource]) -> TypeAdapter[Any]:
+    """Return the validator for a resource class, shared by every parser instance."""
+    return TypeAdapter(resource_class)
+
+
 class ManifestParser:
     """Parses YAML manifests into structured resources."""
 
     def __init__(self) -> None:
-        self.resource_registry = RESOURCE_REGISTRY.copy()
+        self.resource_registry: Mapping[str, Type[Resource]] = RESOURCE_REGISTRY_VIEW
+        self._kind_buckets: Dict[str, Optional[str]] = dict(_KIND_BUCKETS)
 
     def register_resource_type(self, kind: str, resource_class: Type[Resource]) -> None:
         """Register a new resource type for parsing."""
-        self.resource_registry[kind] = resource_class
-
-    def parse_manifest(self, file_path: str) -> ParsedManifest:
-        """Parse a YAML manifest file into structured resources."""
-        tools = []
-        models = []
-        llm_agents = []
-        sequential_agents = []
-        loop_agents = []
-        parallel_agents = []
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            docs = yaml.safe_load_all(f)
-            for doc in docs:
-                if not doc:
-                    continue
-
-                kind = doc.get("kind")
-                if kind not in self.resource_registry:
-                    print(f"Warning: Unknown kind '{kind}' found in manifest. Skipping.")
-                    continue
-
-                resource_class = self.resource_registry[kind]
-                resource = resource_class(**doc)
-
-                # Categorize resources
-                if isinstance(resource, ToolResource):
-                    tools.append(resource)
-                elif isinstance(resource, ModelResource):
-                    models.append(resource)
-                elif isinstance(resource, LlmAgentResource):
-                    llm_agents.append(resource)
-                elif isinstance(resource, SequentialAgentResource):
-                    sequential_agents.append(resource)
-                elif isinstance(resource, LoopAgentResource):
-                    loop_agents.append(resource)
-                elif isinstance(resource, ParallelAgentResource):
-                    parallel_agents.append(resource)
-
-        manifest = ParsedManifest(
-            tools=tools,
-            models=models,
-            llm_agents=llm_agents,
-            sequential_agents=sequential_agents,
-            loop_agents=loop_agents,
-            parallel_agents=parallel_agents,
-        )
-
-        print(
-            f"Parsed {len(tools)} tool(s), {len(models)} model(s), "
-            f"{len(llm_agents)} LlmAgent(s), {len(sequential_agents)} SequentialAgent(s), "
-            f"{len(loop_agents)} LoopAgent(s), {len(parallel_agents)} ParallelAgent(s)."
+        # Copy-on-write: parsers share the global registry until they add their own kinds
+        registry = dict(self.resource_registry)
+        registry[kind] = resource_class
+        self.resource_registry = registry
+        self._kind_buckets[kind] = _bucket_for_class(resource_class)
+
+    def _build_resource(self, doc: Any) -> Optional[Tuple[Optional[str], Resource]]:
+        """Validate one manifest document, returning its manifest bucket and resource."""
+        kind = doc.get("kind")
+        if isinstance(kind, str):
+            kind = sys.intern(kind)
+        try:
+            bucket = self._kind_buckets[kind]
+            adapter = _adapter_for(self.resource_registry[kind])
+        except KeyError:
+            logger.warning("Warning: Unknown kind '%s' found in manifest. Skipping.", kind)
+            return None
+
+        return bucket, adapter.validate_python(doc)
+
+    @staticmethod
+    def _read_manifest(file_path: str) -> bytes:
+        """Read a manifest file in one call."""
+        # Both loaders accept raw bytes and detect the encoding themselves; a single read
+        # hands libyaml one contiguous buffer instead of many small stream reads
+        with open(file_path, "rb") as f:
+            return f.read()
+
+    @staticmethod
+    def _load_documents(data: Union[str, bytes]) -> Iterator[Any]:
+        """Lazily load the YAML documents of a manifest."""
+        import yaml
+
+        return yaml.load_all(data, Loader=_safe_loader())
+
+    @staticmethod
+    def _select_documents(docs: Iterable[Any], kinds: Optional[Iterable[str]]) -> Iterator[Any]:
+        """Yield the non-empty documents of a manifest, keeping only the given kinds."""
+        wanted = None if kinds is None else frozenset(kinds)
+        for doc in docs:
+            # Filtering on the raw kind skips validation of documents the caller discards
+            if doc and (wanted is None or doc.get("kind") in wanted):
+                yield doc
+
+    def iter_manifest(
+        self, file_path: str, kinds: Optional[Iterable[str]] = None
+    ) -> Iterator[Resource]:
+        """Lazily parse and validate a YAML manifest, yielding one resource at a time."""
+        docs = self._load_documents(self._read_manifest(file_path))
+        for doc in self._select_documents(docs, kinds):
+            entry = self._build_resource(doc)
+            if entry is not None:
+                yield entry[1]
+
+    def parse_manifest(
+        self, file_path: str, kinds: Optional[Iterable[str]] = None
+    ) -> ParsedManifest:
+        """Parse a YAML manifest file into structured resources, optionally only some kinds."""
+        return self.parse_documents(self._load_documents(self._read_manifest(file_path)), kinds)
+
+    def parse_manifest_string(
+        self, text: str, kinds: Optional[Iterable[str]] = None
+    ) -> ParsedManifest:
+        """Parse YAML manifest text into structured resources, optionally only some kinds."""
+        return self.parse_documents(self._load_documents(text), kinds)
+
+    def parse_documents(
+        self, documents: Iterable[Any], kinds: Optional[Iterable[str]] = None
+    ) -> ParsedManifest:
+        """Validate already-loaded manifest documents into structured resources."""
+        docs = list(self._select_documents(documents, kinds))
+
+        built = [self._build_resource(doc) for doc in docs]
+
+        # Manifests usually list resources of one kind together, so extend each bucket
+        # once per run of same-kind documents instead of appending one resource at a time
+        buckets: Dict[str, Any] = {bucket: [] for _, bucket in _CLASS_BUCKETS}
+        placed = [entry for entry in built if entry is not None and entry[0] is not None]
+        for bucket, run in groupby(placed, key=itemgetter(0)):
+            buckets[bucket].extend([resource for _, resource in run])
+
+        # Resources are already validated; skip re-validating them as manifest fields
+        manifest = ParsedManifest.model_construct(**buckets)
+
+        logger.info(
+            "Parsed %d tool(s), %d model(s), %d LlmAgent(s), %d SequentialAgent(s), "
+            "%d LoopAgent(s), %d ParallelAgent(s).",
+            len(manifest.tools),
+            len(manifest.models),
+            len(manifest.llm_agents),
+            len(manifest.sequential_agents),
+            len(manifest.loop_agents),
+            len(manifest.parallel_agents),
         )
 
         return manifest
 
     def validate_manifest(self, manifest: ParsedManifest) -> List[str]:
         """Validate the parsed manifest for consistency."""
-        errors = []
-
-        # Check that all referenced models exist
+        errors: List[str] = []
+        append = errors.append
         model_names = {model.metadata.name for model in manifest.models}
+        tool_names = {tool.metadata.name for tool in manifest.tools}
+        agent_names = {agent.metadata.name for agent in manifest.iter_all_agents()}
+
+        # Check that every model and tool an LlmAgent references exists
         for agent in manifest.llm_agents:
-            if agent.spec.modelRef not in model_names:
-                errors.append(
+            spec = agent.spec
+            if spec.modelRef not in model_names:
+                append(
                     f"LlmAgent '{agent.metadata.name}' references unknown model "
-                    f"'{agent.spec.modelRef}'"
+                    f"'{spec.modelRef}'"
                 )
+            for tool_ref in spec.toolRefs or ():
+                if tool_ref not in tool_names:
+                    append(f"LlmAgent '{agent.metadata.name}' references unknown tool '{tool_ref}'")
 
-        # Check that all referenced tools exist
-        tool_names = {tool.metadata.name for tool in manifest.tools}
-        for agent in manifest.llm_agents:
-            if agent.spec.toolRefs:
-                for tool_ref in agent.spec.toolRefs:
-                    if tool_ref not in tool_names:
-                        errors.append(
-                            f"LlmAgent '{agent.metadata.name}' references unknown tool '{tool_ref}'"
-                        )
-
-        # Check that all referenced sub-agents exist
-        agent_names = {agent.metadata.name for agent in manifest.get_all_agents()}
-
-        # Validate SequentialAgent references
-        for seq_agent in manifest.sequential_agents:
-            for sub_agent_ref in seq_agent.spec.subAgentRefs:
-                if sub_agent_ref not in agent_names:
-                    errors.append(
-                        f"SequentialAgent '{seq_agent.metadata.name}' references "
-                        f"unknown sub-agent '{sub_agent_ref}'"
-                    )
-
-        # Validate LoopAgent references
-        for loop_agent in manifest.loop_agents:
-            for sub_agent_ref in loop_agent.spec.subAgentRefs:
-                if sub_agent_ref not in agent_names:
-                    errors.append(
-                        f"LoopAgent '{loop_agent.metadata.name}' references "
-                        f"unknown sub-agent '{sub_agent_ref}'"
-                    )
-
-        # Validate ParallelAgent references
-        for parallel_agent in manifest.parallel_agents:
-            for sub_agent_ref in parallel_agent.spec.subAgentRefs:
+        # Check that every sub-agent a workflow agent references exists
+        workflow_agents: Iterable[WorkflowAgentResource] = chain(
+            manifest.sequential_agents, manifest.loop_agents, manifest.parallel_agents
+        )
+        for workflow_agent in workflow_agents:
+            for sub_agent_ref in workflow_agent.spec.subAgentRefs:
                 if sub_agent_ref not in agent_names:
-                    errors.append(
-                        f"ParallelAgent '{parallel_agent.metadata.name}' references "
+                    append(
+                        f"{workflow_agent.kind} '{workflow_agent.metadata.name}' references "
                         f"unknown sub-agent '{sub_agent_ref}'"
                     )
 
@@ -140,21 +232,12 @@ class ManifestParser:
 
     def find_root_agents(self, manifest: ParsedManifest) -> List[str]:
         """Find agents that are not referenced by any workflow agent (potential root agents)."""
-        all_sub_agent_refs = set()
-
-        # Collect sub-agent references from all workflow agents
-        for seq_agent in manifest.sequential_agents:
-            all_sub_agent_refs.update(seq_agent.spec.subAgentRefs)
-        for loop_agent in manifest.loop_agents:
-            all_sub_agent_refs.update(loop_agent.spec.subAgentRefs)
-        for parallel_agent in manifest.parallel_agents:
-            all_sub_agent_refs.update(parallel_agent.spec.subAgentRefs)
-
-        root_agents = [
-            agent.metadata.name
-            for agent in manifest.get_all_agents()
-            if agent.metadata.name not in all_sub_agent_refs
-        ]
+        workflow_agents: Iterable[WorkflowAgentResource] = chain(
+            manifest.sequential_agents, manifest.loop_agents, manifest.parallel_agents
+        )
+        sub_agent_refs = {ref for agent in workflow_agents for ref in agent.spec.subAgentRefs}
+        agent_names = dict.fromkeys(agent.metadata.name for agent in manifest.iter_all_agents())
+        root_agents = [name for name in agent_names if name not in sub_agent_refs]
 
         if not root_agents:
             raise ValueError("Could not determine a root agent. Check for circular dependencies.")
@@ -3,7 +3,7 @@ Base classes for provider implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from ..core.models import ParsedManifest
 
@@ -62,20 +62,32 @@ class ProviderRegistry:
 
     def __init__(self) -> None:
         self._providers: Dict[str, CodeGenerator] = {}
+        self._factories: Dict[str, Callable[[], CodeGenerator]] = {}
 
     def register(self, name: str, generator: CodeGenerator) -> None:
         """Register a provider."""
         self._providers[name] = generator
+        self._factories.pop(name, None)
+
+    def register_lazy(self, name: str, factory: Callable[[], CodeGenerator]) -> None:
+        """Register a provider that is only imported and built when first requested."""
+        self._factories[name] = factory
+        self._providers.pop(name, None)
 
     def get(self, name: str) -> CodeGenerator:
         """Get a provider by name."""
         if name not in self._providers:
-            raise ValueError(f"Unknown provider: {name}")
+            factory = self._factories.get(name)
+            if factory is None:
+                raise ValueError(f"Unknown provider: {name}")
+            # Keep the factory registered until it succeeds so a failed build can be retried
+            self._providers[name] = factory()
+            del self._factories[name]
         return self._providers[name]
 
     def list_providers(self) -> List[str]:
         """List all registered providers."""
-        return list(self._providers.keys())
+        return list({**self._factories, **self._providers}.keys())
 
 
 # Global provider registry
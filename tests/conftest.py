@@ -0,0 +1,73 @@
+"""
+Shared pytest fixtures for Konductor tests.
+"""
+
+import pytest
+
+from konductor.core.generator import KonductorGenerator
+from konductor.core.parser import ManifestParser
+from tests.fixtures.test_manifests import (
+    ECHO_AGENT_MANIFEST,
+    INVALID_PROVIDER_MANIFEST,
+    INVALID_REFERENCES_MANIFEST,
+    PARSED_COMPLETE_MANIFEST,
+    PARSED_COMPLETE_MANIFEST_WITH_NEW_AGENTS,
+    PARSED_LOOP_AGENT_MANIFEST,
+    PARSED_PARALLEL_AGENT_MANIFEST,
+    PARSED_SEQUENTIAL_AGENT_MANIFEST,
+    PARSED_SIMPLE_AGENT_ONLY_MANIFEST,
+    PARSED_SIMPLE_MODEL_MANIFEST,
+    PARSED_SIMPLE_TOOL_MANIFEST,
+    SIMPLE_AGENT_MANIFEST,
+)
+
+# Loaded manifest fixtures that are validated once per test session
+MANIFEST_FIXTURES = {
+    "simple_tool": PARSED_SIMPLE_TOOL_MANIFEST,
+    "simple_model": PARSED_SIMPLE_MODEL_MANIFEST,
+    "simple_agent": PARSED_SIMPLE_AGENT_ONLY_MANIFEST,
+    "sequential_agent": PARSED_SEQUENTIAL_AGENT_MANIFEST,
+    "loop_agent": PARSED_LOOP_AGENT_MANIFEST,
+    "parallel_agent": PARSED_PARALLEL_AGENT_MANIFEST,
+    "complete": PARSED_COMPLETE_MANIFEST,
+    "complete_with_new_agents": PARSED_COMPLETE_MANIFEST_WITH_NEW_AGENTS,
+}
+
+
+@pytest.fixture(scope="session")
+def parsed_manifests():
+    """Parsed manifests keyed by fixture name; shared, so tests must not modify them."""
+    parser = ManifestParser()
+    return {name: parser.parse_documents(docs) for name, docs in MANIFEST_FIXTURES.items()}
+
+
+@pytest.fixture(scope="session")
+def konductor_generator():
+    """Google ADK KonductorGenerator shared by the whole test session."""
+    return KonductorGenerator(provider="google_adk")
+
+
+# Manifest sources written to disk once per test session, keyed by fixture name
+MANIFEST_SOURCES = {
+    "simple_agent": SIMPLE_AGENT_MANIFEST,
+    "echo_agent": ECHO_AGENT_MANIFEST,
+    "invalid_references": INVALID_REFERENCES_MANIFEST,
+    "invalid_provider": INVALID_PROVIDER_MANIFEST,
+}
+
+
+@pytest.fixture(scope="session")
+def manifest_paths(tmp_path_factory):
+    """Paths of the MANIFEST_SOURCES files, keyed by name; tests must not modify them."""
+    directory = tmp_path_factory.mktemp("manifests")
+    paths = {}
+    for name, text in MANIFEST_SOURCES.items():
+        paths[name] = directory / f"{name}.yaml"
+        paths[name].write_text(text)
+    return paths
+
+
+@pytest.fixture(scope="session")
+def simple_manifest_path(manifest_paths):
+    """Path to SIMPLE_AGENT_MANIFEST written once per test session."""
+    return str(manifest_paths["simple_agent"])
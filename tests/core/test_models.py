@@ -39,6 +39,14 @@ class TestMetadata:
         assert metadata.labels == {"env": "test", "version": "1.0"}
         assert metadata.annotations == {"description": "A test resource"}
 
+    def test_metadata_is_frozen_and_ignores_extra_keys(self):
+        """Test that metadata is read-only and drops unknown keys."""
+        metadata = Metadata(name="test-resource", owner="someone")
+        assert not hasattr(metadata, "owner")
+
+        with pytest.raises(ValidationError):
+            metadata.name = "renamed"
+
 
 class TestToolResource:
     """Test the ToolResource model."""
@@ -424,6 +432,22 @@ class TestParsedManifest:
         not_found = manifest.find_agent_by_name("nonexistent")
         assert not_found is None
 
+    def test_name_lookups_follow_reassigned_lists(self):
+        """Test that name lookups follow a resource list that is replaced."""
+        agent_data = {
+            "apiVersion": "adk.google.com/v1alpha1",
+            "kind": "LlmAgent",
+            "metadata": {"name": "test_agent"},
+            "spec": {"modelRef": "model1", "instruction": "Test"},
+        }
+
+        manifest = ParsedManifest(llm_agents=[LlmAgentResource(**agent_data)])
+        assert manifest.find_agent_by_name("test_agent") is not None
+
+        manifest.llm_agents = []
+        assert manifest.find_agent_by_name("test_agent") is None
+        assert manifest.get_all_agents() == []
+
 
 class TestResourceRegistry:
     """Test the resource registry."""
@@ -2,17 +2,21 @@
 Unit tests for core parser functionality.
 """
 
-import os
-import tempfile
-from unittest.mock import mock_open, patch
+import logging
+from functools import lru_cache
+from unittest.mock import patch
 
 import pytest
+import yaml
 
+from konductor.core import parser as parser_module
 from konductor.core.models import (
+    RESOURCE_REGISTRY,
     LlmAgentResource,
     LoopAgentResource,
     ModelResource,
     ParallelAgentResource,
+    ParsedManifest,
     SequentialAgentResource,
     ToolResource,
 )
@@ -21,259 +25,324 @@ from tests.fixtures.test_manifests import (
     COMPLETE_MANIFEST,
     COMPLETE_MANIFEST_WITH_NEW_AGENTS,
     INVALID_MANIFEST_MISSING_FIELDS,
-    INVALID_MANIFEST_UNKNOWN_KIND,
-    LOOP_AGENT_MANIFEST,
-    PARALLEL_AGENT_MANIFEST,
-    SEQUENTIAL_AGENT_MANIFEST,
+    PARSED_COMPLETE_MANIFEST,
+    PARSED_INVALID_MANIFEST_UNKNOWN_KIND,
     SIMPLE_AGENT_ONLY_MANIFEST,
     SIMPLE_MODEL_MANIFEST,
-    SIMPLE_TOOL_MANIFEST,
 )
 
+API_VERSION = "adk.google.com/v1alpha1"
+
+# ParsedManifest fields holding each kind of resource
+MANIFEST_BUCKETS = (
+    "tools",
+    "models",
+    "llm_agents",
+    "sequential_agents",
+    "loop_agents",
+    "parallel_agents",
+)
+
+# Expected attribute values of the resource in each single-resource fixture
+SINGLE_RESOURCE_EXPECTATIONS = {
+    "simple_tool": {
+        "metadata.name": "test_tool",
+        "spec.description": "A test tool",
+        "spec.source.file": "tools/test.py",
+        "spec.source.functionName": "test_function",
+    },
+    "simple_model": {
+        "metadata.name": "test_model",
+        "spec.provider": "google",
+        "spec.modelId": "gemini-2.5-flash",
+        "spec.parameters": {"temperature": 0.7},
+    },
+    "simple_agent": {
+        "metadata.name": "test_agent",
+        "spec.modelRef": "test_model",
+        "spec.instruction": "You are a test agent",
+        "spec.toolRefs": ["test_tool"],
+    },
+    "sequential_agent": {
+        "metadata.name": "test_sequential",
+        "spec.subAgentRefs": ["test_agent"],
+    },
+    "loop_agent": {
+        "metadata.name": "test_loop",
+        "spec.subAgentRefs": ["test_agent"],
+        "spec.maxIterations": 5,
+    },
+    "parallel_agent": {
+        "metadata.name": "test_parallel",
+        "spec.subAgentRefs": ["test_agent1", "test_agent2"],
+    },
+}
+
+
+@pytest.fixture(scope="class")
+def parser():
+    """Parser shared by the tests of a class; tests must not register types on it."""
+    return ManifestParser()
+
+
+@pytest.fixture
+def isolated_parser():
+    """Fresh parser for tests that register resource types or patch parser methods."""
+    return ManifestParser()
+
+
+# Resources are frozen, so each distinct one is built once and shared between tests
+@lru_cache(maxsize=None)
+def make_tool(name):
+    """Build a Python-function tool resource."""
+    return ToolResource(
+        apiVersion=API_VERSION,
+        kind="Tool",
+        metadata={"name": name},
+        spec={
+            "type": "pythonFunction",
+            "description": "A test tool",
+            "source": {"file": "tools/test.py", "functionName": "test_function"},
+            "parameters": [{"name": "input", "type": "string", "description": "Test input"}],
+        },
+    )
+
+
+@lru_cache(maxsize=None)
+def make_model(name):
+    """Build a Google model resource."""
+    return ModelResource(
+        apiVersion=API_VERSION,
+        kind="LlmModel",
+        metadata={"name": name},
+        spec={"provider": "google", "modelId": "gemini-2.5-flash"},
+    )
+
+
+@lru_cache(maxsize=None)
+def make_llm_agent(name, tool_refs=()):
+    """Build an LlmAgent resource using test_model."""
+    return LlmAgentResource(
+        apiVersion=API_VERSION,
+        kind="LlmAgent",
+        metadata={"name": name},
+        spec={
+            "modelRef": "test_model",
+            "instruction": "You are a test agent",
+            "toolRefs": list(tool_refs),
+        },
+    )
+
+
+@lru_cache(maxsize=None)
+def make_sequential_agent(name, *sub_agent_refs):
+    """Build a SequentialAgent resource."""
+    return SequentialAgentResource(
+        apiVersion=API_VERSION,
+        kind="SequentialAgent",
+        metadata={"name": name},
+        spec={"subAgentRefs": list(sub_agent_refs)},
+    )
+
+
+@lru_cache(maxsize=None)
+def make_loop_agent(name, *sub_agent_refs):
+    """Build a LoopAgent resource."""
+    return LoopAgentResource(
+        apiVersion=API_VERSION,
+        kind="LoopAgent",
+        metadata={"name": name},
+        spec={"subAgentRefs": list(sub_agent_refs), "maxIterations": 3},
+    )
+
+
+@lru_cache(maxsize=None)
+def make_parallel_agent(name, *sub_agent_refs):
+    """Build a ParallelAgent resource."""
+    return ParallelAgentResource(
+        apiVersion=API_VERSION,
+        kind="ParallelAgent",
+        metadata={"name": name},
+        spec={"subAgentRefs": list(sub_agent_refs)},
+    )
+
 
 class TestManifestParser:
     """Test the ManifestParser class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = ManifestParser()
-
-    def test_parser_initialization(self):
+    def test_parser_initialization(self, parser):
         """Test parser initialization."""
-        assert self.parser is not None
-        assert "Tool" in self.parser.resource_registry
-        assert "LlmAgent" in self.parser.resource_registry
+        assert parser is not None
+        assert "Tool" in parser.resource_registry
+        assert "LlmAgent" in parser.resource_registry
 
-    def test_register_resource_type(self):
+    def test_parser_prefers_libyaml_loader(self):
+        """Test that the C-backed safe loader is used whenever PyYAML provides it."""
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        assert parser_module._safe_loader() is expected
+
+    def test_register_resource_type(self, isolated_parser):
         """Test registering a new resource type."""
 
         class CustomResource:
             pass
 
-        self.parser.register_resource_type("Custom", CustomResource)
-        assert self.parser.resource_registry["Custom"] == CustomResource
-
-    def test_parse_simple_tool_manifest(self):
-        """Test parsing a simple tool manifest."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(SIMPLE_TOOL_MANIFEST)
-            f.flush()
-
-            try:
-                manifest = self.parser.parse_manifest(f.name)
-
-                assert len(manifest.tools) == 1
-                assert len(manifest.models) == 0
-                assert len(manifest.llm_agents) == 0
-                assert len(manifest.sequential_agents) == 0
-                assert len(manifest.loop_agents) == 0
-                assert len(manifest.parallel_agents) == 0
-
-                tool = manifest.tools[0]
-                assert isinstance(tool, ToolResource)
-                assert tool.metadata.name == "test_tool"
-                assert tool.spec.description == "A test tool"
-                assert tool.spec.source.file == "tools/test.py"
-                assert tool.spec.source.functionName == "test_function"
-            finally:
-                os.unlink(f.name)
-
-    def test_parse_simple_model_manifest(self):
-        """Test parsing a simple model manifest."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(SIMPLE_MODEL_MANIFEST)
-            f.flush()
-
-            try:
-                manifest = self.parser.parse_manifest(f.name)
-
-                assert len(manifest.tools) == 0
-                assert len(manifest.models) == 1
-                assert len(manifest.llm_agents) == 0
-                assert len(manifest.sequential_agents) == 0
-                assert len(manifest.loop_agents) == 0
-                assert len(manifest.parallel_agents) == 0
-
-                model = manifest.models[0]
-                assert isinstance(model, ModelResource)
-                assert model.metadata.name == "test_model"
-                assert model.spec.provider == "google"
-                assert model.spec.modelId == "gemini-2.5-flash"
-                assert model.spec.parameters["temperature"] == 0.7
-            finally:
-                os.unlink(f.name)
-
-    def test_parse_simple_agent_manifest(self):
-        """Test parsing a simple agent manifest."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(SIMPLE_AGENT_ONLY_MANIFEST)
-            f.flush()
-
-            try:
-                manifest = self.parser.parse_manifest(f.name)
-
-                assert len(manifest.tools) == 0
-                assert len(manifest.models) == 0
-                assert len(manifest.llm_agents) == 1
-                assert len(manifest.sequential_agents) == 0
-                assert len(manifest.loop_agents) == 0
-                assert len(manifest.parallel_agents) == 0
-
-                agent = manifest.llm_agents[0]
-                assert isinstance(agent, LlmAgentResource)
-                assert agent.metadata.name == "test_agent"
-                assert agent.spec.modelRef == "test_model"
-                assert agent.spec.instruction == "You are a test agent"
-                assert agent.spec.toolRefs == ["test_tool"]
-            finally:
-                os.unlink(f.name)
-
-    def test_parse_sequential_agent_manifest(self):
-        """Test parsing a sequential agent manifest."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(SEQUENTIAL_AGENT_MANIFEST)
-            f.flush()
-
-            try:
-                manifest = self.parser.parse_manifest(f.name)
-
-                assert len(manifest.tools) == 0
-                assert len(manifest.models) == 0
-                assert len(manifest.llm_agents) == 0
-                assert len(manifest.sequential_agents) == 1
-                assert len(manifest.loop_agents) == 0
-                assert len(manifest.parallel_agents) == 0
-
-                agent = manifest.sequential_agents[0]
-                assert isinstance(agent, SequentialAgentResource)
-                assert agent.metadata.name == "test_sequential"
-                assert agent.spec.subAgentRefs == ["test_agent"]
-            finally:
-                os.unlink(f.name)
-
-    def test_parse_loop_agent_manifest(self):
-        """Test parsing a loop agent manifest."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(LOOP_AGENT_MANIFEST)
-            f.flush()
-
-            try:
-                manifest = self.parser.parse_manifest(f.name)
-
-                assert len(manifest.tools) == 0
-                assert len(manifest.models) == 0
-                assert len(manifest.llm_agents) == 0
-                assert len(manifest.sequential_agents) == 0
-                assert len(manifest.loop_agents) == 1
-                assert len(manifest.parallel_agents) == 0
-
-                agent = manifest.loop_agents[0]
-                assert isinstance(agent, LoopAgentResource)
-                assert agent.metadata.name == "test_loop"
-                assert agent.spec.subAgentRefs == ["test_agent"]
-                assert agent.spec.maxIterations == 5
-            finally:
-                os.unlink(f.name)
-
-    def test_parse_parallel_agent_manifest(self):
-        """Test parsing a parallel agent manifest."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(PARALLEL_AGENT_MANIFEST)
-            f.flush()
-
-            try:
-                manifest = self.parser.parse_manifest(f.name)
-
-                assert len(manifest.tools) == 0
-                assert len(manifest.models) == 0
-                assert len(manifest.llm_agents) == 0
-                assert len(manifest.sequential_agents) == 0
-                assert len(manifest.loop_agents) == 0
-                assert len(manifest.parallel_agents) == 1
-
-                agent = manifest.parallel_agents[0]
-                assert isinstance(agent, ParallelAgentResource)
-                assert agent.metadata.name == "test_parallel"
-                assert agent.spec.subAgentRefs == ["test_agent1", "test_agent2"]
-            finally:
-                os.unlink(f.name)
-
-    def test_parse_complete_manifest(self):
+        isolated_parser.register_resource_type("Custom", CustomResource)
+        assert isolated_parser.resource_registry["Custom"] == CustomResource
+
+    def test_register_resource_type_is_local_to_parser(self, isolated_parser):
+        """Test that registering a type doesn't leak into other parsers."""
+
+        class CustomResource:
+            pass
+
+        isolated_parser.register_resource_type("Custom", CustomResource)
+        assert "Custom" not in RESOURCE_REGISTRY
+        assert "Custom" not in ManifestParser().resource_registry
+
+    def test_registered_kind_is_dispatched_by_base_class(self, isolated_parser):
+        """Test that a registered resource subclass lands in its base kind's bucket."""
+
+        class CustomModelResource(ModelResource):
+            pass
+
+        isolated_parser.register_resource_type("CustomModel", CustomModelResource)
+
+        manifest = isolated_parser.parse_manifest_string(
+            SIMPLE_MODEL_MANIFEST.replace("kind: LlmModel", "kind: CustomModel")
+        )
+        assert len(manifest.models) == 1
+        assert isinstance(manifest.models[0], CustomModelResource)
+
+    @pytest.mark.parametrize(
+        "name, bucket, resource_type",
+        [
+            ("simple_tool", "tools", ToolResource),
+            ("simple_model", "models", ModelResource),
+            ("simple_agent", "llm_agents", LlmAgentResource),
+            ("sequential_agent", "sequential_agents", SequentialAgentResource),
+            ("loop_agent", "loop_agents", LoopAgentResource),
+            ("parallel_agent", "parallel_agents", ParallelAgentResource),
+        ],
+    )
+    def test_parse_single_resource_manifest(self, parsed_manifests, name, bucket, resource_type):
+        """Test parsing a manifest holding a single resource of one kind."""
+        manifest = parsed_manifests[name]
+
+        for field in MANIFEST_BUCKETS:
+            assert len(getattr(manifest, field)) == (1 if field == bucket else 0)
+
+        resource = getattr(manifest, bucket)[0]
+        assert isinstance(resource, resource_type)
+        for attribute, expected in SINGLE_RESOURCE_EXPECTATIONS[name].items():
+            value = resource
+            for part in attribute.split("."):
+                value = getattr(value, part)
+            assert value == expected, attribute
+
+    def test_parse_complete_manifest(self, parsed_manifests):
         """Test parsing a complete manifest with multiple resources."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(COMPLETE_MANIFEST)
-            f.flush()
-
-            try:
-                manifest = self.parser.parse_manifest(f.name)
-
-                assert len(manifest.tools) == 1
-                assert len(manifest.models) == 1
-                assert len(manifest.llm_agents) == 1
-                assert len(manifest.sequential_agents) == 1
-                assert len(manifest.loop_agents) == 0
-                assert len(manifest.parallel_agents) == 0
-
-                # Verify each resource type
-                assert manifest.tools[0].metadata.name == "test_tool"
-                assert manifest.models[0].metadata.name == "test_model"
-                assert manifest.llm_agents[0].metadata.name == "test_agent"
-                assert manifest.sequential_agents[0].metadata.name == "test_sequential"
-            finally:
-                os.unlink(f.name)
-
-    def test_parse_complete_manifest_with_new_agents(self):
+        manifest = parsed_manifests["complete"]
+
+        assert len(manifest.tools) == 1
+        assert len(manifest.models) == 1
+        assert len(manifest.llm_agents) == 1
+        assert len(manifest.sequential_agents) == 1
+        assert len(manifest.loop_agents) == 0
+        assert len(manifest.parallel_agents) == 0
+
+        # Verify each resource type
+        assert manifest.tools[0].metadata.name == "test_tool"
+        assert manifest.models[0].metadata.name == "test_model"
+        assert manifest.llm_agents[0].metadata.name == "test_agent"
+        assert manifest.sequential_agents[0].metadata.name == "test_sequential"
+
+    def test_parse_complete_manifest_with_new_agents(self, parsed_manifests):
         """Test parsing a complete manifest with all agent types."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(COMPLETE_MANIFEST_WITH_NEW_AGENTS)
-            f.flush()
-
-            try:
-                manifest = self.parser.parse_manifest(f.name)
-
-                assert len(manifest.tools) == 1
-                assert len(manifest.models) == 1
-                assert len(manifest.llm_agents) == 1
-                assert len(manifest.sequential_agents) == 1
-                assert len(manifest.loop_agents) == 1
-                assert len(manifest.parallel_agents) == 1
-
-                # Verify each resource type
-                assert manifest.tools[0].metadata.name == "test_tool"
-                assert manifest.models[0].metadata.name == "test_model"
-                assert manifest.llm_agents[0].metadata.name == "test_agent"
-                assert manifest.sequential_agents[0].metadata.name == "test_sequential"
-                assert manifest.loop_agents[0].metadata.name == "test_loop"
-                assert manifest.parallel_agents[0].metadata.name == "test_parallel"
-            finally:
-                os.unlink(f.name)
-
-    def test_parse_unknown_kind_warning(self):
+        manifest = parsed_manifests["complete_with_new_agents"]
+
+        assert len(manifest.tools) == 1
+        assert len(manifest.models) == 1
+        assert len(manifest.llm_agents) == 1
+        assert len(manifest.sequential_agents) == 1
+        assert len(manifest.loop_agents) == 1
+        assert len(manifest.parallel_agents) == 1
+
+        # Verify each resource type
+        assert manifest.tools[0].metadata.name == "test_tool"
+        assert manifest.models[0].metadata.name == "test_model"
+        assert manifest.llm_agents[0].metadata.name == "test_agent"
+        assert manifest.sequential_agents[0].metadata.name == "test_sequential"
+        assert manifest.loop_agents[0].metadata.name == "test_loop"
+        assert manifest.parallel_agents[0].metadata.name == "test_parallel"
+
+    def test_parse_unknown_kind_warning(self, parser, caplog):
         """Test that unknown kinds produce warnings but don't fail."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(INVALID_MANIFEST_UNKNOWN_KIND)
-            f.flush()
-
-            try:
-                with patch("builtins.print") as mock_print:
-                    manifest = self.parser.parse_manifest(f.name)
-
-                    # Should produce a warning
-                    mock_print.assert_called()
-                    print_args = [call.args[0] for call in mock_print.call_args_list]
-                    assert any("Unknown kind 'UnknownKind'" in arg for arg in print_args)
-
-                    # Manifest should be empty
-                    assert len(manifest.tools) == 0
-                    assert len(manifest.models) == 0
-                    assert len(manifest.llm_agents) == 0
-                    assert len(manifest.sequential_agents) == 0
-                    assert len(manifest.loop_agents) == 0
-                    assert len(manifest.parallel_agents) == 0
-            finally:
-                os.unlink(f.name)
-
-    def test_parse_empty_document(self):
+        with caplog.at_level(logging.WARNING, logger="konductor"):
+            manifest = parser.parse_documents(PARSED_INVALID_MANIFEST_UNKNOWN_KIND)
+
+        # Should produce a warning
+        assert "Warning: Unknown kind 'UnknownKind'" in caplog.text
+
+        # Manifest should be empty
+        assert len(manifest.tools) == 0
+        assert len(manifest.models) == 0
+        assert len(manifest.llm_agents) == 0
+        assert len(manifest.sequential_agents) == 0
+        assert len(manifest.loop_agents) == 0
+        assert len(manifest.parallel_agents) == 0
+
+    def test_parse_large_manifest_preserves_order(self, parser):
+        """Test that resources keep document order across a 100-document manifest."""
+        agent_count = 100
+        manifest_content = "\n---\n".join(
+            SIMPLE_AGENT_ONLY_MANIFEST.replace("test_agent", f"agent_{i}")
+            for i in range(agent_count)
+        )
+
+        manifest = parser.parse_manifest_string(manifest_content)
+        assert [agent.metadata.name for agent in manifest.llm_agents] == [
+            f"agent_{i}" for i in range(agent_count)
+        ]
+
+    def test_parse_manifest_filters_kinds(self, isolated_parser):
+        """Test that only the requested kinds are parsed."""
+        with patch.object(
+            isolated_parser, "_build_resource", wraps=isolated_parser._build_resource
+        ) as build:
+            manifest = isolated_parser.parse_documents(PARSED_COMPLETE_MANIFEST, kinds={"LlmModel"})
+
+        assert len(manifest.models) == 1
+        assert manifest.tools == []
+        assert manifest.llm_agents == []
+        assert build.call_count == 1
+
+    def test_parse_manifest_from_file(self, parser, parsed_manifests, tmp_path):
+        """Test that parsing a manifest file matches parsing its text."""
+        manifest_path = tmp_path / "manifest.yaml"
+        manifest_path.write_text(COMPLETE_MANIFEST_WITH_NEW_AGENTS)
+
+        manifest = parser.parse_manifest(str(manifest_path))
+        assert manifest == parsed_manifests["complete_with_new_agents"]
+
+    def test_iter_manifest_yields_resources_lazily(self, parser, tmp_path):
+        """Test that iter_manifest yields validated resources in document order."""
+        manifest_path = tmp_path / "manifest.yaml"
+        manifest_path.write_text(COMPLETE_MANIFEST)
+
+        resources = parser.iter_manifest(str(manifest_path))
+        first = next(resources)
+        assert isinstance(first, ModelResource)
+        assert first.metadata.name == "test_model"
+
+        remaining = list(resources)
+        assert [type(resource) for resource in remaining] == [
+            ToolResource,
+            LlmAgentResource,
+            SequentialAgentResource,
+        ]
+
+    def test_parse_empty_document(self, parser):
         """Test parsing manifest with empty documents."""
         manifest_content = """
 ---
@@ -290,165 +359,92 @@ spec:
 # Another empty document
 """
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(manifest_content)
-            f.flush()
-
-            try:
-                manifest = self.parser.parse_manifest(f.name)
-                assert len(manifest.models) == 1
-                assert manifest.models[0].metadata.name == "test_model"
-            finally:
-                os.unlink(f.name)
+        manifest = parser.parse_manifest_string(manifest_content)
+        assert len(manifest.models) == 1
+        assert manifest.models[0].metadata.name == "test_model"
 
 
 class TestManifestValidation:
     """Test manifest validation functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = ManifestParser()
-
     def create_test_manifest(self):
         """Create a test manifest for validation."""
-        tool_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "Tool",
-            "metadata": {"name": "test_tool"},
-            "spec": {
-                "type": "pythonFunction",
-                "description": "A test tool",
-                "source": {"file": "tools/test.py", "functionName": "test_function"},
-                "parameters": [{"name": "input", "type": "string", "description": "Test input"}],
-            },
-        }
-
-        model_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmModel",
-            "metadata": {"name": "test_model"},
-            "spec": {"provider": "google", "modelId": "gemini-2.5-flash"},
-        }
-
-        agent_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmAgent",
-            "metadata": {"name": "test_agent"},
-            "spec": {
-                "modelRef": "test_model",
-                "instruction": "You are a test agent",
-                "toolRefs": ["test_tool"],
-            },
-        }
-
-        seq_agent_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "SequentialAgent",
-            "metadata": {"name": "test_sequential"},
-            "spec": {"subAgentRefs": ["test_agent"]},
-        }
-
-        from konductor.core.models import ParsedManifest
-
         return ParsedManifest(
-            tools=[ToolResource(**tool_data)],
-            models=[ModelResource(**model_data)],
-            llm_agents=[LlmAgentResource(**agent_data)],
-            sequential_agents=[SequentialAgentResource(**seq_agent_data)],
+            tools=[make_tool("test_tool")],
+            models=[make_model("test_model")],
+            llm_agents=[make_llm_agent("test_agent", tool_refs=("test_tool",))],
+            sequential_agents=[make_sequential_agent("test_sequential", "test_agent")],
         )
 
-    def test_validate_valid_manifest(self):
+    def test_validate_valid_manifest(self, parser):
         """Test validation of a valid manifest."""
         manifest = self.create_test_manifest()
-        errors = self.parser.validate_manifest(manifest)
+        errors = parser.validate_manifest(manifest)
         assert len(errors) == 0
 
-    def test_validate_missing_model_reference(self):
+    def test_validate_missing_model_reference(self, parser):
         """Test validation error for missing model reference."""
         manifest = self.create_test_manifest()
         # Remove the model
         manifest.models = []
 
-        errors = self.parser.validate_manifest(manifest)
+        errors = parser.validate_manifest(manifest)
         assert len(errors) == 1
         assert "unknown model 'test_model'" in errors[0]
 
-    def test_validate_missing_tool_reference(self):
+    def test_validate_missing_tool_reference(self, parser):
         """Test validation error for missing tool reference."""
         manifest = self.create_test_manifest()
         # Remove the tool
         manifest.tools = []
 
-        errors = self.parser.validate_manifest(manifest)
+        errors = parser.validate_manifest(manifest)
         assert len(errors) == 1
         assert "unknown tool 'test_tool'" in errors[0]
 
-    def test_validate_missing_sub_agent_reference(self):
+    def test_validate_missing_sub_agent_reference(self, parser):
         """Test validation error for missing sub-agent reference."""
         manifest = self.create_test_manifest()
         # Remove the LLM agent
         manifest.llm_agents = []
 
-        errors = self.parser.validate_manifest(manifest)
+        errors = parser.validate_manifest(manifest)
         assert len(errors) == 1
         assert "unknown sub-agent 'test_agent'" in errors[0]
 
-    def test_validate_multiple_errors(self):
+    def test_validate_multiple_errors(self, parser):
         """Test validation with multiple errors."""
         manifest = self.create_test_manifest()
         # Remove both model and tool
         manifest.models = []
         manifest.tools = []
 
-        errors = self.parser.validate_manifest(manifest)
+        errors = parser.validate_manifest(manifest)
         assert len(errors) == 2
         error_text = " ".join(errors)
         assert "unknown model 'test_model'" in error_text
         assert "unknown tool 'test_tool'" in error_text
 
-    def test_validate_loop_agent_references(self):
+    def test_validate_loop_agent_references(self, parser):
         """Test validation of LoopAgent references."""
-        from konductor.core.models import ParsedManifest
-
         # Create a loop agent that references non-existent sub-agents
-        loop_agent_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LoopAgent",
-            "metadata": {"name": "test_loop"},
-            "spec": {
-                "subAgentRefs": ["nonexistent_agent"],
-                "maxIterations": 3,
-            },
-        }
+        manifest = ParsedManifest(loop_agents=[make_loop_agent("test_loop", "nonexistent_agent")])
 
-        manifest = ParsedManifest(
-            loop_agents=[LoopAgentResource(**loop_agent_data)],
-        )
-
-        errors = self.parser.validate_manifest(manifest)
+        errors = parser.validate_manifest(manifest)
         assert len(errors) == 1
         error_text = " ".join(errors)
         assert "unknown sub-agent 'nonexistent_agent'" in error_text
 
-    def test_validate_parallel_agent_references(self):
+    def test_validate_parallel_agent_references(self, parser):
         """Test validation of ParallelAgent references."""
-        from konductor.core.models import ParsedManifest
-
         # Create a parallel agent that references non-existent sub-agents
-        parallel_agent_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "ParallelAgent",
-            "metadata": {"name": "test_parallel"},
-            "spec": {
-                "subAgentRefs": ["nonexistent_agent1", "nonexistent_agent2"],
-            },
-        }
-
         manifest = ParsedManifest(
-            parallel_agents=[ParallelAgentResource(**parallel_agent_data)],
+            parallel_agents=[
+                make_parallel_agent("test_parallel", "nonexistent_agent1", "nonexistent_agent2")
+            ],
         )
 
-        errors = self.parser.validate_manifest(manifest)
+        errors = parser.validate_manifest(manifest)
         assert len(errors) == 2
         error_text = " ".join(errors)
         assert "unknown sub-agent 'nonexistent_agent1'" in error_text
@@ -458,189 +454,75 @@ class TestManifestValidation:
 class TestRootAgentIdentification:
     """Test root agent identification functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = ManifestParser()
-
-    def test_find_root_agents_single_agent(self):
+    def test_find_root_agents_single_agent(self, parser):
         """Test finding root agent with single agent."""
-        agent_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmAgent",
-            "metadata": {"name": "root-agent"},
-            "spec": {"modelRef": "test_model", "instruction": "You are a root agent"},
-        }
-
-        from konductor.core.models import ParsedManifest
-
-        manifest = ParsedManifest(llm_agents=[LlmAgentResource(**agent_data)])
+        manifest = ParsedManifest(llm_agents=[make_llm_agent("root-agent")])
 
-        root_agents = self.parser.find_root_agents(manifest)
+        root_agents = parser.find_root_agents(manifest)
         assert len(root_agents) == 1
         assert root_agents[0] == "root-agent"
 
-    def test_find_root_agents_with_sequential(self):
+    def test_find_root_agents_with_sequential(self, parser):
         """Test finding root agent with sequential agent."""
-        llm_agent_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmAgent",
-            "metadata": {"name": "sub-agent"},
-            "spec": {"modelRef": "test_model", "instruction": "You are a sub agent"},
-        }
-
-        seq_agent_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "SequentialAgent",
-            "metadata": {"name": "root-sequential"},
-            "spec": {"subAgentRefs": ["sub-agent"]},
-        }
-
-        from konductor.core.models import ParsedManifest
-
         manifest = ParsedManifest(
-            llm_agents=[LlmAgentResource(**llm_agent_data)],
-            sequential_agents=[SequentialAgentResource(**seq_agent_data)],
+            llm_agents=[make_llm_agent("sub-agent")],
+            sequential_agents=[make_sequential_agent("root-sequential", "sub-agent")],
         )
 
-        root_agents = self.parser.find_root_agents(manifest)
+        root_agents = parser.find_root_agents(manifest)
         assert len(root_agents) == 1
         assert root_agents[0] == "root-sequential"
 
-    def test_find_root_agents_multiple_roots(self):
+    def test_find_root_agents_multiple_roots(self, parser):
         """Test finding multiple root agents."""
-        agent1_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmAgent",
-            "metadata": {"name": "root-agent-1"},
-            "spec": {"modelRef": "test_model", "instruction": "You are root agent 1"},
-        }
-
-        agent2_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmAgent",
-            "metadata": {"name": "root-agent-2"},
-            "spec": {"modelRef": "test_model", "instruction": "You are root agent 2"},
-        }
-
-        from konductor.core.models import ParsedManifest
-
         manifest = ParsedManifest(
-            llm_agents=[LlmAgentResource(**agent1_data), LlmAgentResource(**agent2_data)]
+            llm_agents=[make_llm_agent("root-agent-1"), make_llm_agent("root-agent-2")]
         )
 
-        root_agents = self.parser.find_root_agents(manifest)
+        root_agents = parser.find_root_agents(manifest)
         assert len(root_agents) == 2
         assert set(root_agents) == {"root-agent-1", "root-agent-2"}
 
-    def test_find_root_agents_no_agents(self):
+    def test_find_root_agents_no_agents(self, parser):
         """Test finding root agents with no agents."""
-        from konductor.core.models import ParsedManifest
-
         manifest = ParsedManifest()
 
         with pytest.raises(ValueError, match="Could not determine a root agent"):
-            self.parser.find_root_agents(manifest)
+            parser.find_root_agents(manifest)
 
-    def test_find_root_agents_with_loop_agent(self):
+    def test_find_root_agents_with_loop_agent(self, parser):
         """Test finding root agent with loop agent."""
-        llm_agent_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmAgent",
-            "metadata": {"name": "sub-agent"},
-            "spec": {"modelRef": "test_model", "instruction": "You are a sub agent"},
-        }
-
-        loop_agent_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LoopAgent",
-            "metadata": {"name": "root-loop"},
-            "spec": {"subAgentRefs": ["sub-agent"], "maxIterations": 3},
-        }
-
-        from konductor.core.models import ParsedManifest
-
         manifest = ParsedManifest(
-            llm_agents=[LlmAgentResource(**llm_agent_data)],
-            loop_agents=[LoopAgentResource(**loop_agent_data)],
+            llm_agents=[make_llm_agent("sub-agent")],
+            loop_agents=[make_loop_agent("root-loop", "sub-agent")],
         )
 
-        root_agents = self.parser.find_root_agents(manifest)
+        root_agents = parser.find_root_agents(manifest)
         assert len(root_agents) == 1
         assert root_agents[0] == "root-loop"
 
-    def test_find_root_agents_with_parallel_agent(self):
+    def test_find_root_agents_with_parallel_agent(self, parser):
         """Test finding root agent with parallel agent."""
-        llm_agent1_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmAgent",
-            "metadata": {"name": "sub-agent-1"},
-            "spec": {"modelRef": "test_model", "instruction": "You are sub agent 1"},
-        }
-
-        llm_agent2_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmAgent",
-            "metadata": {"name": "sub-agent-2"},
-            "spec": {"modelRef": "test_model", "instruction": "You are sub agent 2"},
-        }
-
-        parallel_agent_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "ParallelAgent",
-            "metadata": {"name": "root-parallel"},
-            "spec": {"subAgentRefs": ["sub-agent-1", "sub-agent-2"]},
-        }
-
-        from konductor.core.models import ParsedManifest
-
         manifest = ParsedManifest(
-            llm_agents=[LlmAgentResource(**llm_agent1_data), LlmAgentResource(**llm_agent2_data)],
-            parallel_agents=[ParallelAgentResource(**parallel_agent_data)],
+            llm_agents=[make_llm_agent("sub-agent-1"), make_llm_agent("sub-agent-2")],
+            parallel_agents=[make_parallel_agent("root-parallel", "sub-agent-1", "sub-agent-2")],
         )
 
-        root_agents = self.parser.find_root_agents(manifest)
+        root_agents = parser.find_root_agents(manifest)
         assert len(root_agents) == 1
         assert root_agents[0] == "root-parallel"
 
-    def test_find_root_agents_complex_hierarchy(self):
+    def test_find_root_agents_complex_hierarchy(self, parser):
         """Test finding root agent with complex hierarchy involving all agent types."""
-        llm_agent_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmAgent",
-            "metadata": {"name": "base-agent"},
-            "spec": {"modelRef": "test_model", "instruction": "You are a base agent"},
-        }
-
-        loop_agent_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LoopAgent",
-            "metadata": {"name": "loop-processor"},
-            "spec": {"subAgentRefs": ["base-agent"], "maxIterations": 3},
-        }
-
-        parallel_agent_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "ParallelAgent",
-            "metadata": {"name": "parallel-processor"},
-            "spec": {"subAgentRefs": ["base-agent"]},
-        }
-
-        seq_agent_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "SequentialAgent",
-            "metadata": {"name": "root-orchestrator"},
-            "spec": {"subAgentRefs": ["loop-processor", "parallel-processor"]},
-        }
-
-        from konductor.core.models import ParsedManifest
-
         manifest = ParsedManifest(
-            llm_agents=[LlmAgentResource(**llm_agent_data)],
-            loop_agents=[LoopAgentResource(**loop_agent_data)],
-            parallel_agents=[ParallelAgentResource(**parallel_agent_data)],
-            sequential_agents=[SequentialAgentResource(**seq_agent_data)],
+            llm_agents=[make_llm_agent("base-agent")],
+            loop_agents=[make_loop_agent("loop-processor", "base-agent")],
+            parallel_agents=[make_parallel_agent("parallel-processor", "base-agent")],
+            sequential_agents=[
+                make_sequential_agent("root-orchestrator", "loop-processor", "parallel-processor")
+            ],
         )
 
-        root_agents = self.parser.find_root_agents(manifest)
+        root_agents = parser.find_root_agents(manifest)
         assert len(root_agents) == 1
         assert root_agents[0] == "root-orchestrator"
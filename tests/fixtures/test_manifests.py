@@ -2,6 +2,16 @@
 Test fixture manifests for unit tests.
 """
 
+import yaml
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _load(manifest: str) -> list:
+    """Load a fixture manifest into its YAML documents."""
+    return list(yaml.load_all(manifest, Loader=_Loader))
+
+
 SIMPLE_TOOL_MANIFEST = """
 apiVersion: adk.google.com/v1alpha1
 kind: Tool
@@ -124,3 +134,182 @@ metadata:
 spec:
   field: value
 """
+
+ECHO_AGENT_MANIFEST = """
+apiVersion: adk.google.com/v1alpha1
+kind: LlmModel
+metadata:
+  name: test-model
+spec:
+  provider: google
+  modelId: "gemini-2.5-flash"
+  parameters:
+    temperature: 0.7
+---
+apiVersion: adk.google.com/v1alpha1
+kind: Tool
+metadata:
+  name: echo-tool
+spec:
+  type: pythonFunction
+  description: A simple echo tool
+  source:
+    file: "tools/echo.py"
+    functionName: "echo_function"
+  parameters:
+    - name: "message"
+      type: "string"
+      description: "Message to echo"
+---
+apiVersion: adk.google.com/v1alpha1
+kind: LlmAgent
+metadata:
+  name: echo-agent
+spec:
+  modelRef: test-model
+  instruction: "You are an echo agent that repeats messages."
+  toolRefs:
+    - echo-tool
+"""
+
+INVALID_REFERENCES_MANIFEST = """
+apiVersion: adk.google.com/v1alpha1
+kind: LlmAgent
+metadata:
+  name: invalid-agent
+spec:
+  modelRef: nonexistent-model
+  instruction: "This agent references a model that doesn't exist."
+  toolRefs:
+    - nonexistent-tool
+"""
+
+INVALID_PROVIDER_MANIFEST = """
+apiVersion: adk.google.com/v1alpha1
+kind: LlmModel
+metadata:
+  name: invalid-model
+spec:
+  provider: openai
+  modelId: "gpt-4"
+---
+apiVersion: adk.google.com/v1alpha1
+kind: LlmAgent
+metadata:
+  name: test-agent
+spec:
+  modelRef: invalid-model
+  instruction: "This uses an unsupported provider."
+"""
+
+IDEA_PIPELINE_MANIFEST = """
+apiVersion: adk.google.com/v1alpha1
+kind: LlmModel
+metadata:
+  name: creative-model
+spec:
+  provider: google
+  modelId: "gemini-2.5-flash"
+  parameters:
+    temperature: 0.8
+---
+apiVersion: adk.google.com/v1alpha1
+kind: LlmModel
+metadata:
+  name: focused-model
+spec:
+  provider: google
+  modelId: "gemini-2.5-flash"
+  parameters:
+    temperature: 0.2
+---
+apiVersion: adk.google.com/v1alpha1
+kind: LlmAgent
+metadata:
+  name: idea-generator
+spec:
+  modelRef: creative-model
+  instruction: "Generate creative ideas."
+  output_key: "ideas"
+---
+apiVersion: adk.google.com/v1alpha1
+kind: LlmAgent
+metadata:
+  name: idea-refiner
+spec:
+  modelRef: focused-model
+  instruction: "Refine the ideas: {ideas}"
+---
+apiVersion: adk.google.com/v1alpha1
+kind: SequentialAgent
+metadata:
+  name: pipeline
+spec:
+  subAgentRefs:
+    - idea-generator
+    - idea-refiner
+"""
+
+SYNTAX_CHECK_MANIFEST = """
+apiVersion: adk.google.com/v1alpha1
+kind: LlmModel
+metadata:
+  name: syntax-test-model
+spec:
+  provider: google
+  modelId: "gemini-2.5-flash"
+---
+apiVersion: adk.google.com/v1alpha1
+kind: LlmAgent
+metadata:
+  name: syntax-test-agent
+spec:
+  modelRef: syntax-test-model
+  instruction: "Test agent for syntax validation."
+"""
+
+NESTED_TOOL_SOURCE_MANIFEST = """
+apiVersion: adk.google.com/v1alpha1
+kind: LlmModel
+metadata:
+  name: import-test-model
+spec:
+  provider: google
+  modelId: "gemini-2.5-flash"
+---
+apiVersion: adk.google.com/v1alpha1
+kind: Tool
+metadata:
+  name: import-test-tool
+spec:
+  type: pythonFunction
+  description: A test tool
+  source:
+    file: "some/nested/path/tool.py"
+    functionName: "test_function"
+  parameters:
+    - name: "input"
+      type: "string"
+      description: "Test input"
+---
+apiVersion: adk.google.com/v1alpha1
+kind: LlmAgent
+metadata:
+  name: import-test-agent
+spec:
+  modelRef: import-test-model
+  instruction: "Test agent for import validation."
+  toolRefs:
+    - import-test-tool
+"""
+
+# Fixture manifests loaded once at import, for ManifestParser.parse_documents
+PARSED_SIMPLE_TOOL_MANIFEST = _load(SIMPLE_TOOL_MANIFEST)
+PARSED_SIMPLE_MODEL_MANIFEST = _load(SIMPLE_MODEL_MANIFEST)
+PARSED_SIMPLE_AGENT_ONLY_MANIFEST = _load(SIMPLE_AGENT_ONLY_MANIFEST)
+PARSED_SEQUENTIAL_AGENT_MANIFEST = _load(SEQUENTIAL_AGENT_MANIFEST)
+PARSED_LOOP_AGENT_MANIFEST = _load(LOOP_AGENT_MANIFEST)
+PARSED_PARALLEL_AGENT_MANIFEST = _load(PARALLEL_AGENT_MANIFEST)
+PARSED_COMPLETE_MANIFEST = _load(COMPLETE_MANIFEST)
+PARSED_COMPLETE_MANIFEST_WITH_NEW_AGENTS = _load(COMPLETE_MANIFEST_WITH_NEW_AGENTS)
+PARSED_INVALID_MANIFEST_UNKNOWN_KIND = _load(INVALID_MANIFEST_UNKNOWN_KIND)
@@ -2,14 +2,18 @@
 Unit tests for Google ADK provider generator.
 """
 
+import copy
+import logging
 import os
-import tempfile
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from jinja2 import FileSystemBytecodeCache
 
 from konductor.core.models import (
     LlmAgentResource,
+    LoopAgentResource,
     ModelResource,
     ParsedManifest,
     SequentialAgentResource,
@@ -18,12 +22,71 @@ from konductor.core.models import (
 from konductor.providers.google_adk.generator import GoogleAdkGenerator
 
 
+@pytest.fixture(scope="module")
+def generator():
+    """Generator shared by every test in this module, along with its compiled templates."""
+    return GoogleAdkGenerator()
+
+
+@pytest.fixture(scope="class")
+def base_manifest():
+    """Test manifest shared by a test class; tests that modify it work on a deep copy."""
+    tool_data = {
+        "apiVersion": "adk.google.com/v1alpha1",
+        "kind": "Tool",
+        "metadata": {"name": "test-tool"},
+        "spec": {
+            "type": "pythonFunction",
+            "description": "A test tool",
+            "source": {"file": "tools/test.py", "functionName": "test_function"},
+            "parameters": [{"name": "input", "type": "string", "description": "Test input"}],
+        },
+    }
+
+    model_data = {
+        "apiVersion": "adk.google.com/v1alpha1",
+        "kind": "LlmModel",
+        "metadata": {"name": "test-model"},
+        "spec": {
+            "provider": "google",
+            "modelId": "gemini-2.5-flash",
+            "parameters": {"temperature": 0.7},
+        },
+    }
+
+    agent_data = {
+        "apiVersion": "adk.google.com/v1alpha1",
+        "kind": "LlmAgent",
+        "metadata": {"name": "test-agent"},
+        "spec": {
+            "modelRef": "test-model",
+            "instruction": "You are a test agent",
+            "toolRefs": ["test-tool"],
+        },
+    }
+
+    return ParsedManifest(
+        tools=[ToolResource(**tool_data)],
+        models=[ModelResource(**model_data)],
+        llm_agents=[LlmAgentResource(**agent_data)],
+    )
+
+
+@pytest.fixture(scope="class")
+def generated(generator, base_manifest, tmp_path_factory):
+    """Files generated once from base_manifest, read back from disk and keyed by name."""
+    output_dir = tmp_path_factory.mktemp("generated")
+    generated_files = generator.generate_code(base_manifest, str(output_dir))
+    return {Path(path).name: Path(path).read_text() for path in generated_files}
+
+
 class TestGoogleAdkGenerator:
     """Test the GoogleAdkGenerator class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.generator = GoogleAdkGenerator()
+    @pytest.fixture(autouse=True)
+    def _inject(self, generator):
+        """Expose the shared generator to the tests."""
+        self.generator = generator
 
     def test_generator_initialization(self):
         """Test generator initialization."""
@@ -31,129 +94,61 @@ class TestGoogleAdkGenerator:
         assert self.generator.templates_dir.endswith("templates")
         assert self.generator.env is not None
 
-    def test_get_required_dependencies(self):
-        """Test getting required dependencies."""
-        deps = self.generator.get_required_dependencies()
-        assert "google-adk>=1.10.0" in deps
+    def test_generators_share_template_environment(self):
+        """Test that generators reuse one compiled template environment."""
+        assert GoogleAdkGenerator().env is self.generator.env
 
-    def create_test_manifest(self):
-        """Create a test manifest for generation."""
-        tool_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "Tool",
-            "metadata": {"name": "test-tool"},
-            "spec": {
-                "type": "pythonFunction",
-                "description": "A test tool",
-                "source": {"file": "tools/test.py", "functionName": "test_function"},
-                "parameters": [{"name": "input", "type": "string", "description": "Test input"}],
-            },
-        }
+    def test_bytecode_cache_populated(self, monkeypatch, tmp_path):
+        """Test that templates compiled by the generator are written to its bytecode cache."""
+        env = self.generator.env
+        assert isinstance(env.bytecode_cache, FileSystemBytecodeCache)
 
-        model_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmModel",
-            "metadata": {"name": "test-model"},
-            "spec": {
-                "provider": "google",
-                "modelId": "gemini-2.5-flash",
-                "parameters": {"temperature": 0.7},
-            },
-        }
+        monkeypatch.setattr(env.bytecode_cache, "directory", str(tmp_path))
+        env.cache.clear()
+        env.get_template("agent.py.j2")
 
-        agent_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmAgent",
-            "metadata": {"name": "test-agent"},
-            "spec": {
-                "modelRef": "test-model",
-                "instruction": "You are a test agent",
-                "toolRefs": ["test-tool"],
-            },
-        }
+        assert any(tmp_path.iterdir())
 
-        return ParsedManifest(
-            tools=[ToolResource(**tool_data)],
-            models=[ModelResource(**model_data)],
-            llm_agents=[LlmAgentResource(**agent_data)],
-        )
+    def test_get_required_dependencies(self):
+        """Test getting required dependencies."""
+        deps = self.generator.get_required_dependencies()
+        assert "google-adk>=1.10.0" in deps
 
-    def test_generate_code_creates_files(self):
+    def test_generate_code_creates_files(self, generated):
         """Test that code generation creates expected files."""
-        manifest = self.create_test_manifest()
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            generated_files = self.generator.generate_code(manifest, temp_dir)
-
-            # Check that all expected files are created
-            expected_files = ["tools.py", "agent.py", "main.py", "__init__.py"]
-            for expected_file in expected_files:
-                file_path = os.path.join(temp_dir, expected_file)
-                assert os.path.exists(file_path), f"File {expected_file} was not created"
-                assert file_path in generated_files
-
-            # Check that files have content
-            for file_path in generated_files:
-                with open(file_path, "r") as f:
-                    content = f.read()
-                    assert len(content) > 0, f"File {file_path} is empty"
-
-    def test_generate_tools_py_content(self):
-        """Test the content of generated tools.py file."""
-        manifest = self.create_test_manifest()
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            generated_files = self.generator.generate_code(manifest, temp_dir)
-            tools_path = os.path.join(temp_dir, "tools.py")
-
-            with open(tools_path, "r") as f:
-                content = f.read()
-
-            # Check for expected imports
-            assert "from tools.test import test_function" in content
-            assert "auto-generated" in content
-
-    def test_generate_agent_py_content(self):
-        """Test the content of generated agent.py file."""
-        manifest = self.create_test_manifest()
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            generated_files = self.generator.generate_code(manifest, temp_dir)
-            agent_path = os.path.join(temp_dir, "agent.py")
-
-            with open(agent_path, "r") as f:
-                content = f.read()
-
-            # Check for expected content
-            assert "from google.adk.agents import LlmAgent" in content
-            assert "MODEL_CONFIG_MAP" in content
-            assert "TOOL_FUNCTION_MAP" in content
-            assert "test-model" in content
-            assert "gemini-2.5-flash" in content
-            assert "test-agent" in content
-            assert "You are a test agent" in content
-            assert "root_agent" in content
-
-    def test_generate_main_py_content(self):
-        """Test the content of generated main.py file."""
-        manifest = self.create_test_manifest()
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            generated_files = self.generator.generate_code(manifest, temp_dir)
-            main_path = os.path.join(temp_dir, "main.py")
-
-            with open(main_path, "r") as f:
-                content = f.read()
-
-            # Check for expected content
-            assert "from google.adk.runners import Runner" in content
-            assert "from .agent import root_agent" in content
-            assert "async def main():" in content
-            assert "generated-konductor-app" in content
-
-    def test_generate_with_sequential_agent(self):
+        # Check that all expected files are created
+        assert set(generated) == {"tools.py", "agent.py", "main.py", "__init__.py"}
+
+        # Check that files have content
+        for filename, content in generated.items():
+            assert len(content) > 0, f"File {filename} is empty"
+
+    @pytest.mark.parametrize(
+        "filename,needle",
+        [
+            ("tools.py", "from tools.test import test_function"),
+            ("tools.py", "auto-generated"),
+            ("agent.py", "from google.adk.agents import LlmAgent"),
+            ("agent.py", "MODEL_CONFIG_MAP"),
+            ("agent.py", "TOOL_FUNCTION_MAP"),
+            ("agent.py", "test-model"),
+            ("agent.py", "gemini-2.5-flash"),
+            ("agent.py", "test-agent"),
+            ("agent.py", "You are a test agent"),
+            ("agent.py", "root_agent"),
+            ("main.py", "from google.adk.runners import Runner"),
+            ("main.py", "from .agent import root_agent"),
+            ("main.py", "async def main():"),
+            ("main.py", "generated-konductor-app"),
+        ],
+    )
+    def test_generated_contains(self, generated, filename, needle):
+        """Test that each generated file contains the expected content."""
+        assert needle in generated[filename]
+
+    def test_generate_with_sequential_agent(self, base_manifest, tmp_path):
         """Test code generation with sequential agent."""
-        manifest = self.create_test_manifest()
+        manifest = copy.deepcopy(base_manifest)
 
         # Add a sequential agent
         seq_agent_data = {
@@ -164,34 +159,84 @@ class TestGoogleAdkGenerator:
         }
         manifest.sequential_agents = [SequentialAgentResource(**seq_agent_data)]
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            generated_files = self.generator.generate_code(manifest, temp_dir)
-            agent_path = os.path.join(temp_dir, "agent.py")
-
-            with open(agent_path, "r") as f:
-                content = f.read()
+        self.generator.generate_code(manifest, str(tmp_path))
+        content = (tmp_path / "agent.py").read_text()
+
+        # Check for sequential agent content
+        assert "SequentialAgent" in content
+        assert "test-sequential" in content
+        assert "sub_agents" in content
+
+    def test_topological_sort_is_independent_of_manifest_order(self):
+        """Test that agents are sorted deterministically regardless of manifest order."""
+
+        def llm_agent(name):
+            return LlmAgentResource(
+                **{
+                    "apiVersion": "adk.google.com/v1alpha1",
+                    "kind": "LlmAgent",
+                    "metadata": {"name": name},
+                    "spec": {"modelRef": "test-model", "instruction": "Test"},
+                }
+            )
+
+        seq_agent = SequentialAgentResource(
+            **{
+                "apiVersion": "adk.google.com/v1alpha1",
+                "kind": "SequentialAgent",
+                "metadata": {"name": "pipeline"},
+                "spec": {"subAgentRefs": ["writer", "reviewer"]},
+            }
+        )
 
-            # Check for sequential agent content
-            assert "SequentialAgent" in content
-            assert "test-sequential" in content
-            assert "sub_agents" in content
+        forward = ParsedManifest(
+            llm_agents=[llm_agent("writer"), llm_agent("reviewer")],
+            sequential_agents=[seq_agent],
+        )
+        backward = ParsedManifest(
+            llm_agents=[llm_agent("reviewer"), llm_agent("writer")],
+            sequential_agents=[seq_agent],
+        )
 
-    def test_generate_with_model_parameters(self):
+        forward_order = [
+            agent.metadata.name for agent in self.generator._topological_sort_agents(forward)
+        ]
+        backward_order = [
+            agent.metadata.name for agent in self.generator._topological_sort_agents(backward)
+        ]
+
+        assert forward_order == backward_order == ["reviewer", "writer", "pipeline"]
+
+    def test_topological_sort_counts_repeated_sub_agent_once(self, base_manifest):
+        """Test that a sub-agent referenced twice is still sorted before its parent."""
+        manifest = copy.deepcopy(base_manifest)
+        manifest.loop_agents = [
+            LoopAgentResource(
+                **{
+                    "apiVersion": "adk.google.com/v1alpha1",
+                    "kind": "LoopAgent",
+                    "metadata": {"name": "test-loop"},
+                    "spec": {"subAgentRefs": ["test-agent", "test-agent"]},
+                }
+            )
+        ]
+
+        sorted_agents = self.generator._topological_sort_agents(manifest)
+
+        assert [agent.metadata.name for agent in sorted_agents] == [
+            "test-agent",
+            "test-loop",
+        ]
+
+    def test_generate_with_model_parameters(self, generated):
         """Test code generation with model parameters."""
-        manifest = self.create_test_manifest()
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            generated_files = self.generator.generate_code(manifest, temp_dir)
-            agent_path = os.path.join(temp_dir, "agent.py")
+        content = generated["agent.py"]
 
-            with open(agent_path, "r") as f:
-                content = f.read()
+        # Check for model parameters
+        assert "GenerateContentConfig" in content
+        assert "temperature=0.7" in content
 
-            # Check for model parameters
-            assert "GenerateContentConfig" in content
-            assert "temperature=0.7" in content
-
-    def test_generate_without_tools(self):
+    def test_generate_without_tools(self, tmp_path):
         """Test code generation without tools."""
         manifest = ParsedManifest(
             models=[
@@ -220,101 +265,100 @@ class TestGoogleAdkGenerator:
             ],
         )
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            generated_files = self.generator.generate_code(manifest, temp_dir)
+        generated_files = self.generator.generate_code(manifest, str(tmp_path))
 
-            # Should still generate all files
-            assert len(generated_files) == 4
+        # Should still generate all files
+        assert len(generated_files) == 4
 
-            tools_path = os.path.join(temp_dir, "tools.py")
-            with open(tools_path, "r") as f:
-                content = f.read()
+        content = (tmp_path / "tools.py").read_text()
 
-            # tools.py should be minimal but valid
-            assert "auto-generated" in content
+        # tools.py should be minimal but valid
+        assert "auto-generated" in content
 
+    def test_generate_code_logs_progress(self, base_manifest, caplog, tmp_path):
+        """Test that progress is reported through logging rather than stdout."""
+        manifest = base_manifest
 
-class TestGoogleAdkValidation:
-    """Test Google ADK specific validation."""
+        output_dir = str(tmp_path)
+        with caplog.at_level(logging.INFO, logger="konductor"):
+            generated_files = self.generator.generate_code(manifest, output_dir)
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.generator = GoogleAdkGenerator()
+        assert "Identified 'test-agent' as the root agent." in caplog.messages
+        for file_path in generated_files:
+            assert f"Generated {file_path}" in caplog.messages
 
-    def test_validate_google_provider(self):
-        """Test validation passes for Google provider."""
-        model_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmModel",
-            "metadata": {"name": "test-model"},
-            "spec": {"provider": "google", "modelId": "gemini-2.5-flash"},
-        }
+    def test_regenerate_leaves_unchanged_files_alone(self, base_manifest, tmp_path):
+        """Test that regenerating identical output does not rewrite existing files."""
+        manifest = base_manifest
 
-        manifest = ParsedManifest(models=[ModelResource(**model_data)])
-        errors = self.generator.validate_manifest_for_provider(manifest)
-        assert len(errors) == 0
+        output_dir = str(tmp_path)
+        generated_files = self.generator.generate_code(manifest, output_dir)
+        for file_path in generated_files:
+            os.utime(file_path, ns=(0, 0))
 
-    def test_validate_non_google_provider(self):
-        """Test validation fails for non-Google provider."""
-        model_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmModel",
-            "metadata": {"name": "test-model"},
-            "spec": {"provider": "openai", "modelId": "gpt-4"},
-        }
+        self.generator.generate_code(manifest, output_dir)
 
-        manifest = ParsedManifest(models=[ModelResource(**model_data)])
-        errors = self.generator.validate_manifest_for_provider(manifest)
-        assert len(errors) == 2  # Both provider and model ID errors
-        assert any("only supports 'google' provider" in error for error in errors)
-        assert any("doesn't appear to be a Google model" in error for error in errors)
-
-    def test_validate_google_model_id(self):
-        """Test validation of Google model IDs."""
-        # Valid Google model
-        model_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmModel",
-            "metadata": {"name": "test-model"},
-            "spec": {"provider": "google", "modelId": "gemini-2.5-flash"},
-        }
+        for file_path in generated_files:
+            assert os.stat(file_path).st_mtime_ns == 0, f"{file_path} was rewritten"
 
-        manifest = ParsedManifest(models=[ModelResource(**model_data)])
-        errors = self.generator.validate_manifest_for_provider(manifest)
-        assert len(errors) == 0
+    def test_template_error_writes_no_files(self, base_manifest, tmp_path):
+        """Test that a rendering failure leaves the output directory untouched."""
+        manifest = base_manifest
+
+        output_dir = str(tmp_path / "out")
+        with patch.object(
+            self.generator._agent_template, "render", side_effect=RuntimeError("boom")
+        ):
+            with pytest.raises(RuntimeError):
+                self.generator.generate_code(manifest, output_dir)
+
+        assert not os.path.exists(output_dir)
 
-    def test_validate_non_google_model_id(self):
-        """Test validation warning for non-Google model IDs."""
-        model_data = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmModel",
-            "metadata": {"name": "test-model"},
-            "spec": {"provider": "google", "modelId": "unknown-model"},
-        }
 
-        manifest = ParsedManifest(models=[ModelResource(**model_data)])
+class TestGoogleAdkValidation:
+    """Test Google ADK specific validation."""
+
+    @pytest.fixture(autouse=True)
+    def _inject(self, generator):
+        """Expose the shared generator to the tests."""
+        self.generator = generator
+
+    @staticmethod
+    def _model(name, provider, model_id):
+        return ModelResource(
+            apiVersion="adk.google.com/v1alpha1",
+            kind="LlmModel",
+            metadata={"name": name},
+            spec={"provider": provider, "modelId": model_id},
+        )
+
+    @pytest.mark.parametrize(
+        "provider,model_id,needles",
+        [
+            ("google", "gemini-2.5-flash", ()),
+            (
+                "openai",
+                "gpt-4",
+                ("only supports 'google' provider", "doesn't appear to be a Google model"),
+            ),
+            ("google", "unknown-model", ("doesn't appear to be a Google model",)),
+        ],
+    )
+    def test_validate_single_model(self, provider, model_id, needles):
+        """Test provider and model ID validation for a single model."""
+        manifest = ParsedManifest(models=[self._model("test-model", provider, model_id)])
         errors = self.generator.validate_manifest_for_provider(manifest)
-        assert len(errors) == 1
-        assert "doesn't appear to be a Google model" in errors[0]
+        assert len(errors) == len(needles)
+        for needle in needles:
+            assert any(needle in error for error in errors)
 
     def test_validate_multiple_models_mixed(self):
         """Test validation with mix of valid and invalid models."""
-        valid_model = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmModel",
-            "metadata": {"name": "valid-model"},
-            "spec": {"provider": "google", "modelId": "gemini-2.5-flash"},
-        }
-
-        invalid_model = {
-            "apiVersion": "adk.google.com/v1alpha1",
-            "kind": "LlmModel",
-            "metadata": {"name": "invalid-model"},
-            "spec": {"provider": "openai", "modelId": "gpt-4"},
-        }
-
         manifest = ParsedManifest(
-            models=[ModelResource(**valid_model), ModelResource(**invalid_model)]
+            models=[
+                self._model("valid-model", "google", "gemini-2.5-flash"),
+                self._model("invalid-model", "openai", "gpt-4"),
+            ]
         )
         errors = self.generator.validate_manifest_for_provider(manifest)
         assert len(errors) == 2  # Two errors for the invalid model
@@ -2,84 +2,84 @@
 Unit tests for CLI interface.
 """
 
+import logging
 import os
-import sys
-import tempfile
 from io import StringIO
-from unittest.mock import MagicMock, patch
+from unittest.mock import create_autospec
 
 import pytest
 
 from konductor.cli import main
+from konductor.core.generator import KonductorGenerator
 from tests.fixtures.test_manifests import SIMPLE_AGENT_MANIFEST
 
 
+@pytest.fixture
+def mock_generator_class(monkeypatch):
+    """Autospecced KonductorGenerator class patched into the CLI."""
+    generator_class = create_autospec(KonductorGenerator)
+    generator_class.return_value.generate_from_manifest.return_value = {}
+    monkeypatch.setattr("konductor.cli.KonductorGenerator", generator_class)
+    return generator_class
+
+
 class TestCLIGenerate:
     """Test the CLI generate command."""
 
-    def test_generate_command_success(self):
+    @pytest.mark.slow
+    def test_generate_command_success(self, simple_manifest_path, tmp_path):
         """Test successful generate command."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as manifest_file:
-            manifest_file.write(SIMPLE_AGENT_MANIFEST)
-            manifest_file.flush()
+        output_dir = str(tmp_path / "output")
+        main(["generate", simple_manifest_path, "-o", output_dir])  # Should not raise SystemExit
+
+        # Check that files were generated
+        with os.scandir(output_dir) as entries:
+            present = {entry.name for entry in entries}
+        assert {"agent.py", "tools.py", "main.py", "__init__.py"} <= present
 
-            with tempfile.TemporaryDirectory() as output_dir:
-                test_args = ["konductor", "generate", manifest_file.name, "-o", output_dir]
+    @pytest.mark.slow
+    def test_generate_command_with_provider(self, simple_manifest_path, tmp_path):
+        """Test generate command with specific provider."""
+        output_dir = str(tmp_path / "output")
+        main(["generate", simple_manifest_path, "-p", "google_adk", "-o", output_dir])
 
-                with patch.object(sys, "argv", test_args):
-                    main()  # Should not raise SystemExit on success
+        # Check that files were generated
+        assert os.path.exists(os.path.join(output_dir, "agent.py"))
 
-                    # Check that files were generated
-                    assert os.path.exists(os.path.join(output_dir, "agent.py"))
-                    assert os.path.exists(os.path.join(output_dir, "tools.py"))
-                    assert os.path.exists(os.path.join(output_dir, "main.py"))
-                    assert os.path.exists(os.path.join(output_dir, "__init__.py"))
+    def test_generate_command_from_stdin(self, tmp_path, monkeypatch):
+        """Test generate command reading the manifest from stdin."""
+        monkeypatch.setattr("sys.stdin", StringIO(SIMPLE_AGENT_MANIFEST))
 
-            os.unlink(manifest_file.name)
+        output_dir = str(tmp_path / "output")
+        main(["generate", "-", "-o", output_dir])
 
-    def test_generate_command_with_provider(self):
-        """Test generate command with specific provider."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as manifest_file:
-            manifest_file.write(SIMPLE_AGENT_MANIFEST)
-            manifest_file.flush()
-
-            with tempfile.TemporaryDirectory() as output_dir:
-                test_args = [
-                    "konductor",
-                    "generate",
-                    manifest_file.name,
-                    "-p",
-                    "google_adk",
-                    "-o",
-                    output_dir,
-                ]
-
-                with patch.object(sys, "argv", test_args):
-                    main()  # Should not raise SystemExit on success
-
-                    # Check that files were generated
-                    assert os.path.exists(os.path.join(output_dir, "agent.py"))
-
-            os.unlink(manifest_file.name)
-
-    def test_generate_command_missing_file(self):
-        """Test generate command with missing manifest file."""
-        test_args = ["konductor", "generate", "nonexistent_file.yaml"]
+        # Check that files were generated
+        assert os.path.exists(os.path.join(output_dir, "agent.py"))
 
-        with patch.object(sys, "argv", test_args):
-            with patch("builtins.print") as mock_print:
-                with pytest.raises(SystemExit) as exc_info:
-                    main()
+    def test_generate_command_reports_progress(self, simple_manifest_path, tmp_path, capsys):
+        """Test that progress goes to stdout once per run without configuring the root logger."""
+        root_handlers = list(logging.getLogger().handlers)
 
-                # Should exit with error code
-                assert exc_info.value.code == 1
+        output_dir = tmp_path / "output"
+        main(["generate", simple_manifest_path, "-o", str(output_dir)])
+        main(["generate", simple_manifest_path, "-o", str(output_dir)])
 
-                # Should print error message
-                mock_print.assert_called()
-                print_args = [str(call.args[0]) for call in mock_print.call_args_list]
-                assert any("not found" in arg for arg in print_args)
+        output = capsys.readouterr().out
+        assert output.count(f"Generated {output_dir / 'agent.py'}") == 2
+        assert logging.getLogger().handlers == root_handlers
 
-    def test_generate_command_invalid_manifest(self):
+    def test_generate_command_missing_file(self, capsys):
+        """Test generate command with missing manifest file."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["generate", "nonexistent_file.yaml"])
+
+        # Should exit with error code
+        assert exc_info.value.code == 1
+
+        # Should print error message
+        assert "not found" in capsys.readouterr().out
+
+    def test_generate_command_invalid_manifest(self, tmp_path, capsys):
         """Test generate command with invalid manifest."""
         invalid_manifest = """
 apiVersion: adk.google.com/v1alpha1
@@ -90,44 +90,27 @@ spec:
   instruction: "Missing required modelRef field"
 """
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as manifest_file:
-            manifest_file.write(invalid_manifest)
-            manifest_file.flush()
-
-            test_args = ["konductor", "generate", manifest_file.name]
+        manifest_path = tmp_path / "manifest.yaml"
+        manifest_path.write_text(invalid_manifest)
 
-            with patch.object(sys, "argv", test_args):
-                with patch("builtins.print") as mock_print:
-                    with pytest.raises(SystemExit) as exc_info:
-                        main()
+        with pytest.raises(SystemExit) as exc_info:
+            main(["generate", str(manifest_path)])
 
-                    # Should exit with error code
-                    assert exc_info.value.code == 1
+        # Should exit with error code
+        assert exc_info.value.code == 1
 
-                    # Should print error message
-                    mock_print.assert_called()
-                    print_args = [str(call.args[0]) for call in mock_print.call_args_list]
-                    assert any("Error:" in arg for arg in print_args)
-
-            os.unlink(manifest_file.name)
+        # Should print error message
+        assert "Error:" in capsys.readouterr().out
 
 
 class TestCLIListProviders:
     """Test the CLI list-providers command."""
 
-    def test_list_providers_command(self):
+    def test_list_providers_command(self, capsys):
         """Test list-providers command."""
-        test_args = ["konductor", "list-providers"]
-
-        captured_output = StringIO()
-        with patch.object(sys, "argv", test_args):
-            with patch("sys.stdout", captured_output):
-                try:
-                    main()
-                except SystemExit as e:
-                    assert e.code is None or e.code == 0
+        main(["list-providers"])
 
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
         assert "Available providers:" in output
         assert "google_adk" in output
 
@@ -135,35 +118,19 @@ class TestCLIListProviders:
 class TestCLIDependencies:
     """Test the CLI dependencies command."""
 
-    def test_dependencies_command_default(self):
+    def test_dependencies_command_default(self, capsys):
         """Test dependencies command with default provider."""
-        test_args = ["konductor", "dependencies"]
-
-        captured_output = StringIO()
-        with patch.object(sys, "argv", test_args):
-            with patch("sys.stdout", captured_output):
-                try:
-                    main()
-                except SystemExit as e:
-                    assert e.code is None or e.code == 0
+        main(["dependencies"])
 
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
         assert "Dependencies for provider 'google_adk':" in output
         assert "google-adk" in output
 
-    def test_dependencies_command_specific_provider(self):
+    def test_dependencies_command_specific_provider(self, capsys):
         """Test dependencies command with specific provider."""
-        test_args = ["konductor", "dependencies", "-p", "google_adk"]
+        main(["dependencies", "-p", "google_adk"])
 
-        captured_output = StringIO()
-        with patch.object(sys, "argv", test_args):
-            with patch("sys.stdout", captured_output):
-                try:
-                    main()
-                except SystemExit as e:
-                    assert e.code is None or e.code == 0
-
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
         assert "Dependencies for provider 'google_adk':" in output
         assert "google-adk" in output
 
@@ -171,119 +138,67 @@ class TestCLIDependencies:
 class TestCLIHelp:
     """Test CLI help and error handling."""
 
-    def test_no_command_shows_help(self):
+    def test_no_command_shows_help(self, capsys):
         """Test that running without command shows help."""
-        test_args = ["konductor"]
-
-        captured_output = StringIO()
-        with patch.object(sys, "argv", test_args):
-            with patch("sys.stdout", captured_output):
-                main()  # Should not exit, just show help
+        main([])  # Should not exit, just show help
 
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
         assert "usage:" in output.lower() or "konductor" in output
 
-    def test_generate_help(self):
+    def test_generate_help(self, capsys):
         """Test generate command help."""
-        test_args = ["konductor", "generate", "-h"]
-
-        captured_output = StringIO()
-        with patch.object(sys, "argv", test_args):
-            with patch("sys.stdout", captured_output):
-                with pytest.raises(SystemExit) as exc_info:
-                    main()
+        with pytest.raises(SystemExit) as exc_info:
+            main(["generate", "-h"])
 
-                # Help should exit with code 0
-                assert exc_info.value.code == 0
+        # Help should exit with code 0
+        assert exc_info.value.code == 0
 
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
         assert "manifest_file" in output
         assert "--provider" in output or "-p" in output
         assert "--output-dir" in output or "-o" in output
 
-    def test_unknown_provider_error(self):
+    def test_unknown_provider_error(self, simple_manifest_path, capsys):
         """Test error handling for unknown provider."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as manifest_file:
-            manifest_file.write(SIMPLE_AGENT_MANIFEST)
-            manifest_file.flush()
+        with pytest.raises(SystemExit) as exc_info:
+            main(["generate", simple_manifest_path, "-p", "unknown_provider"])
 
-            test_args = ["konductor", "generate", manifest_file.name, "-p", "unknown_provider"]
+        # Should exit with error code
+        assert exc_info.value.code == 1
 
-            with patch.object(sys, "argv", test_args):
-                with patch("builtins.print") as mock_print:
-                    with pytest.raises(SystemExit) as exc_info:
-                        main()
-
-                    # Should exit with error code
-                    assert exc_info.value.code == 1
-
-                    # Should print error message
-                    mock_print.assert_called()
-                    print_args = [str(call.args[0]) for call in mock_print.call_args_list]
-                    assert any("Error:" in arg for arg in print_args)
-
-            os.unlink(manifest_file.name)
+        # Should print error message
+        assert "Error:" in capsys.readouterr().out
 
 
 class TestCLIArguments:
     """Test CLI argument parsing and validation."""
 
-    def test_generate_default_arguments(self):
+    def test_generate_default_arguments(self, simple_manifest_path, mock_generator_class):
         """Test generate command with default arguments."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as manifest_file:
-            manifest_file.write(SIMPLE_AGENT_MANIFEST)
-            manifest_file.flush()
+        main(["generate", simple_manifest_path])  # Should not raise SystemExit on success
 
-            test_args = ["konductor", "generate", manifest_file.name]
+        # Should use default provider and output directory
+        mock_generator_class.assert_called_with(provider="google_adk")
+        generate = mock_generator_class.return_value.generate_from_manifest
+        generate.assert_called_once_with(simple_manifest_path, "generated_agent")
 
-            with patch.object(sys, "argv", test_args):
-                with patch("konductor.cli.KonductorGenerator") as mock_generator_class:
-                    mock_generator = MagicMock()
-                    mock_generator_class.return_value = mock_generator
-                    mock_generator.generate_from_manifest.return_value = {}
+    def test_generate_custom_arguments(self, simple_manifest_path, mock_generator_class):
+        """Test generate command with custom arguments."""
+        main(["generate", simple_manifest_path, "-p", "google_adk", "-o", "custom_output"])
 
-                    main()  # Should not raise SystemExit on success
+        # Should use custom provider and output directory
+        mock_generator_class.assert_called_with(provider="google_adk")
+        generate = mock_generator_class.return_value.generate_from_manifest
+        generate.assert_called_once_with(simple_manifest_path, "custom_output")
 
-                    # Should use default provider and output directory
-                    mock_generator_class.assert_called_with(provider="google_adk")
-                    mock_generator.generate_from_manifest.assert_called_once()
-                    # Check the actual call
-                    call_args = mock_generator.generate_from_manifest.call_args
-                    assert call_args[0][0] == manifest_file.name  # First positional arg
-                    assert call_args[0][1] == "generated_agent"  # Second positional arg
+    def test_generate_stdin_argument(self, mock_generator_class, monkeypatch):
+        """Test that '-' passes the stdin text to the generator."""
+        monkeypatch.setattr("sys.stdin", StringIO(SIMPLE_AGENT_MANIFEST))
 
-            os.unlink(manifest_file.name)
+        main(["generate", "-"])
 
-    def test_generate_custom_arguments(self):
-        """Test generate command with custom arguments."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as manifest_file:
-            manifest_file.write(SIMPLE_AGENT_MANIFEST)
-            manifest_file.flush()
-
-            test_args = [
-                "konductor",
-                "generate",
-                manifest_file.name,
-                "-p",
-                "google_adk",
-                "-o",
-                "custom_output",
-            ]
-
-            with patch.object(sys, "argv", test_args):
-                with patch("konductor.cli.KonductorGenerator") as mock_generator_class:
-                    mock_generator = MagicMock()
-                    mock_generator_class.return_value = mock_generator
-                    mock_generator.generate_from_manifest.return_value = {}
-
-                    main()  # Should not raise SystemExit on success
-
-                    # Should use custom provider and output directory
-                    mock_generator_class.assert_called_with(provider="google_adk")
-                    mock_generator.generate_from_manifest.assert_called_once()
-                    # Check the actual call
-                    call_args = mock_generator.generate_from_manifest.call_args
-                    assert call_args[0][0] == manifest_file.name  # First positional arg
-                    assert call_args[0][1] == "custom_output"  # Second positional arg
-
-            os.unlink(manifest_file.name)
+        generator = mock_generator_class.return_value
+        generator.generate_from_manifest_string.assert_called_once_with(
+            SIMPLE_AGENT_MANIFEST, "generated_agent"
+        )
+        generator.generate_from_manifest.assert_not_called()
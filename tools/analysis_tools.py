@@ -2,6 +2,10 @@
 Text analysis tools.
 """
 
+import random
+
+_SENTIMENTS = ("positive", "negative", "neutral")
+
 
 def analyze_sentiment(text: str) -> dict:
     """
@@ -18,10 +22,7 @@ def analyze_sentiment(text: str) -> dict:
     print(f"Analyzing sentiment of text: {text[:100]}...")
 
     # Simulate sentiment analysis
-    import random
-
-    sentiments = ["positive", "negative", "neutral"]
-    sentiment = random.choice(sentiments)
+    sentiment = random.choice(_SENTIMENTS)
     confidence = random.uniform(0.6, 0.95)
 
     result = {
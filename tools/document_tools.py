@@ -2,23 +2,10 @@
 Document generation and manipulation tools.
 """
 
+from functools import lru_cache
 
-def generate_document(requirements: str) -> str:
-    """
-    Generate documents based on requirements.
-
-    Args:
-        requirements: Document requirements and specifications
-
-    Returns:
-        Generated document content
-    """
-    # This is a placeholder implementation
-    # In a real scenario, this would use sophisticated document generation
-    print(f"Generating document based on: {requirements[:100]}...")
-
-    # Simulate document generation
-    document = f"""
+# Simulated document; only the requirements vary between calls
+_DOCUMENT_TEMPLATE = """
     # Generated Document
     
     ## Introduction
@@ -32,4 +19,23 @@ def generate_document(requirements: str) -> str:
     This document addresses the key points outlined in the requirements.
     """
 
-    return document
+
+@lru_cache(maxsize=256)
+def _document(requirements: str) -> str:
+    return _DOCUMENT_TEMPLATE.format(requirements=requirements)
+
+
+def generate_document(requirements: str) -> str:
+    """
+    Generate documents based on requirements.
+
+    Args:
+        requirements: Document requirements and specifications
+
+    Returns:
+        Generated document content
+    """
+    # This is a placeholder implementation
+    # In a real scenario, this would use sophisticated document generation
+    print(f"Generating document based on: {requirements[:100]}...")
+    return _document(requirements)
@@ -2,6 +2,19 @@
 Image generation and analysis tools for the loop agent example.
 """
 
+import zlib
+from functools import lru_cache
+from itertools import cycle
+
+# Alternate the simulated counts so loop agents reach their exit condition reproducibly
+_COUNTS = cycle((1, 2))
+
+
+@lru_cache(maxsize=256)
+def _image_url(prompt: str) -> str:
+    # crc32 rather than hash() so the same prompt maps to the same URL in every process
+    return f"https://example.com/generated_image_from_{zlib.crc32(prompt.encode())}.jpg"
+
 
 def generate_image(prompt: str) -> str:
     """
@@ -16,7 +29,7 @@ def generate_image(prompt: str) -> str:
     # This is a placeholder implementation
     # In a real scenario, this would integrate with an image generation service
     print(f"Generating image with prompt: {prompt}")
-    return f"https://example.com/generated_image_from_{hash(prompt)}.jpg"
+    return _image_url(prompt)
 
 
 def count_objects(image_url: str, object_type: str) -> int:
@@ -34,9 +47,7 @@ def count_objects(image_url: str, object_type: str) -> int:
     # In a real scenario, this would use computer vision to count objects
     print(f"Counting {object_type} objects in image: {image_url}")
 
-    # Simulate counting with a random result for demo purposes
-    import random
-
-    count = random.randint(1, 2)
+    # Simulate counting for demo purposes
+    count = next(_COUNTS)
     print(f"Found {count} {object_type}(s)")
     return count
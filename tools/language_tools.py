@@ -2,6 +2,16 @@
 Language processing and editing tools.
 """
 
+import random
+
+_GRAMMAR_SUGGESTIONS = (
+    "Consider using active voice",
+    "Check comma placement",
+    "Verify subject-verb agreement",
+)
+_TONES = ("formal", "informal", "academic", "conversational", "professional")
+_STYLES = ("clear", "complex", "concise", "verbose", "balanced")
+
 
 def check_grammar(text: str) -> dict:
     """
@@ -18,18 +28,12 @@ def check_grammar(text: str) -> dict:
     print(f"Checking grammar for text: {text[:100]}...")
 
     # Simulate grammar checking
-    import random
-
     error_count = random.randint(0, 5)
 
     result = {
         "errors_found": error_count,
         "corrected_text": text,  # In real implementation, this would be corrected
-        "suggestions": [
-            "Consider using active voice",
-            "Check comma placement",
-            "Verify subject-verb agreement",
-        ][:error_count],
+        "suggestions": list(_GRAMMAR_SUGGESTIONS[:error_count]),
     }
 
     return result
@@ -49,14 +53,9 @@ def analyze_style(text: str) -> dict:
     print(f"Analyzing style for text: {text[:100]}...")
 
     # Simulate style analysis
-    import random
-
-    tones = ["formal", "informal", "academic", "conversational", "professional"]
-    styles = ["clear", "complex", "concise", "verbose", "balanced"]
-
     result = {
-        "tone": random.choice(tones),
-        "style": random.choice(styles),
+        "tone": random.choice(_TONES),
+        "style": random.choice(_STYLES),
         "readability_score": random.uniform(6.0, 12.0),
         "recommendations": [
             "Maintain consistent tone throughout",
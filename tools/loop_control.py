@@ -2,8 +2,12 @@
 Loop control tools for ADK agents.
 """
 
+import logging
+
 from google.adk.tools.tool_context import ToolContext
 
+logger = logging.getLogger(__name__)
+
 
 def exit_loop(tool_context: ToolContext):
     """
@@ -18,7 +22,7 @@ def exit_loop(tool_context: ToolContext):
     Returns:
         dict: Empty dictionary as tools should return JSON-serializable output
     """
-    print(f"  [Tool Call] exit_loop triggered by {tool_context.agent_name}")
+    logger.debug("exit_loop triggered by %s", tool_context.agent_name)
     tool_context.actions.escalate = True
     # Return empty dict as tools should typically return JSON-serializable output
     return {}
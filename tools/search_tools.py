@@ -2,6 +2,24 @@
 Search and information retrieval tools.
 """
 
+from functools import lru_cache
+
+# Simulated search results; only the query varies between calls
+_SEARCH_RESULTS_TEMPLATE = """
+    Search Results for "{query}":
+    
+    1. Comprehensive information about {query}
+    2. Recent developments and trends related to {query}
+    3. Expert opinions and analysis on {query}
+    4. Statistical data and research findings
+    5. Related topics and additional resources
+    """
+
+
+@lru_cache(maxsize=256)
+def _search_results(query: str) -> str:
+    return _SEARCH_RESULTS_TEMPLATE.format(query=query)
+
 
 def web_search(query: str) -> str:
     """
@@ -16,16 +34,4 @@ def web_search(query: str) -> str:
     # This is a placeholder implementation
     # In a real scenario, this would integrate with a search API
     print(f"Searching for: {query}")
-
-    # Simulate search results
-    results = f"""
-    Search Results for "{query}":
-    
-    1. Comprehensive information about {query}
-    2. Recent developments and trends related to {query}
-    3. Expert opinions and analysis on {query}
-    4. Statistical data and research findings
-    5. Related topics and additional resources
-    """
-
-    return results
+    return _search_results(query)
@@ -2,6 +2,10 @@
 Fact checking and verification tools.
 """
 
+import random
+
+_ACCURACY_LEVELS = ("accurate", "partially accurate", "inaccurate", "unverifiable")
+
 
 def check_facts(claim: str) -> dict:
     """
@@ -17,18 +21,17 @@ def check_facts(claim: str) -> dict:
     # In a real scenario, this would check against fact-checking databases
     print(f"Fact-checking claim: {claim}")
 
-    # Simulate fact checking
-    import random
-
-    accuracy_levels = ["accurate", "partially accurate", "inaccurate", "unverifiable"]
-    accuracy = random.choice(accuracy_levels)
-    confidence = random.uniform(0.5, 0.9)
+    # Simulate fact checking, deriving every field from a single random draw
+    bits = random.getrandbits(16)
+    accuracy = _ACCURACY_LEVELS[bits & 0b11]
+    confidence = 0.5 + ((bits >> 2) & 0xFF) / 0xFF * 0.4
+    sources_checked = 3 + (bits >> 10) % 8
 
     result = {
         "accuracy": accuracy,
         "confidence": confidence,
         "verification": f"Claim is {accuracy} based on available sources (confidence: {confidence:.2f})",
-        "sources_checked": random.randint(3, 10),
+        "sources_checked": sources_checked,
     }
 
     return result
@@ -1,4 +1,30 @@
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple
+
+
+@lru_cache(maxsize=256)
+def _weather_report(city: str) -> Tuple[Tuple[str, str], ...]:
+    # This is a mock implementation for the POC.
+    # In a real scenario, this would call a weather API.
+    city_lower = city.lower()
+    if city_lower == "stockholm":
+        return (
+            ("status", "success"),
+            (
+                "report",
+                "It is currently sunny with a temperature of 18 degrees Celsius in Stockholm.",
+            ),
+        )
+    elif city_lower == "london":
+        return (
+            ("status", "success"),
+            ("report", "It is cloudy with a high chance of rain in London."),
+        )
+    else:
+        return (
+            ("status", "error"),
+            ("message", f"Sorry, weather information for '{city}' is not available."),
+        )
 
 
 def get_weather_report(city: str) -> Dict:
@@ -14,18 +40,5 @@ def get_weather_report(city: str) -> Dict:
         Example error: {'status': 'error', 'message': 'City not found.'}
     """
     print(f"TOOL: Called get_weather_report for city: {city}")
-    # This is a mock implementation for the POC.
-    # In a real scenario, this would call a weather API.
-    city_lower = city.lower()
-    if city_lower == "stockholm":
-        return {
-            "status": "success",
-            "report": "It is currently sunny with a temperature of 18 degrees Celsius in Stockholm.",
-        }
-    elif city_lower == "london":
-        return {"status": "success", "report": "It is cloudy with a high chance of rain in London."}
-    else:
-        return {
-            "status": "error",
-            "message": f"Sorry, weather information for '{city}' is not available.",
-        }
+    # Cached as a tuple of items; each call gets its own dict to mutate
+    return dict(_weather_report(city))